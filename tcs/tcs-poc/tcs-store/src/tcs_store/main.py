@@ -1,5 +1,7 @@
 """Main FastAPI application for TCS Store."""
 
+import os
+
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
@@ -16,7 +18,14 @@ from tcs_store.exceptions import (
 )
 
 # Create singleton instances
-store = InMemoryStore()
+# TCS_STORE_INDEXED_PATHS lists field paths to index, e.g. "data.trade_type,data.notional"
+store = InMemoryStore(
+    indexed_paths=[
+        path.strip()
+        for path in os.getenv("TCS_STORE_INDEXED_PATHS", "").split(",")
+        if path.strip()
+    ]
+)
 trade_service = TradeService(store)
 
 app = FastAPI(
@@ -16,6 +16,7 @@ class TradeFilter(BaseModel):
     # Example: {"data.trade_type": {"eq": "IR_SWAP"}}
     # Example: {"data.trade_date": {"gte": "2024-01-01", "lte": "2024-12-31"}}
     # Example: {"data.counterparty": {"regex": "^BANK.*"}}
+    # In-process callers may pass a compiled re.Pattern as the regex value
     filter: Optional[Dict[str, Any]] = Field(
         None,
         description="Flexible JSON filter with nested field paths and operators"
@@ -1,9 +1,11 @@
 """Trade service with business logic."""
 
 import re
-from typing import Any, Dict, List, Tuple
+from functools import lru_cache
+from operator import ge, gt, le, lt
+from typing import Any, Callable, Dict, List, NamedTuple, Tuple
 
-from tcs_store.storage.in_memory_store import InMemoryStore
+from tcs_store.storage.in_memory_store import InMemoryStore, compile_path
 from tcs_store.models import Context
 from tcs_store.models.filter import TradeFilter
 from tcs_store.exceptions import (
@@ -14,6 +16,287 @@ from tcs_store.exceptions import (
 )
 
 
+def deep_merge(existing: Dict[str, Any], updates: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Deep merge updates into existing data with smart null handling.
+
+    Rules:
+    - If existing value is a dict and update sets it to null → Remove the field
+    - If existing value is a primitive and update sets it to null → Set to null
+    - Nested dicts are merged recursively
+    - Lists are replaced entirely (not merged)
+
+    Args:
+        existing: Existing trade data
+        updates: Updates to merge
+
+    Returns:
+        Merged trade data
+    """
+    result = existing.copy()
+
+    for key, value in updates.items():
+        if value is None:
+            # Smart null handling
+            if key in result:
+                existing_value = result[key]
+                if isinstance(existing_value, dict):
+                    # Remove dict fields when set to null
+                    del result[key]
+                else:
+                    # Set primitives to null
+                    result[key] = None
+            else:
+                # Key doesn't exist, set to null
+                result[key] = None
+        elif isinstance(value, dict) and key in result and isinstance(result[key], dict):
+            # Recursively merge nested dicts
+            result[key] = deep_merge(result[key], value)
+        else:
+            # Replace value (including lists)
+            result[key] = value
+
+    return result
+
+
+# Conditions on one field path:
+# (field_path, accessor, ((operator, expected_value), ...), predicate on the field value)
+FieldConditions = Tuple[
+    str,
+    Callable[[Dict[str, Any]], Any],
+    Tuple[Tuple[str, Any], ...],
+    Callable[[Any], bool],
+]
+
+
+class CompiledFilter(NamedTuple):
+    """Filter criteria prepared by compile_filter."""
+
+    conditions: Tuple[FieldConditions, ...]
+    # True when the criteria contradict themselves (e.g. eq 5 and gt 10),
+    # so no trade can match and the store need not be read
+    never_matches: bool
+
+
+# Evaluation order for AND-ed conditions: equality checks reject most trades
+# cheaply, so they run first; range comparisons next; regex matching last.
+_OPERATOR_RANK = {
+    "eq": 0,
+    "ne": 1,
+    "in": 1,
+    "nin": 1,
+    "gt": 2,
+    "gte": 2,
+    "lt": 2,
+    "lte": 2,
+    "regex": 3,
+}
+
+
+# Range operators; evaluated through _range_predicate
+_RANGE_COMPARISONS = {"gt": gt, "gte": ge, "lt": lt, "lte": le}
+
+
+def _range_predicate(compare: Callable[[Any, Any], bool], expected_value: Any) -> Callable[[Any], bool]:
+    """
+    Build a range check that treats null and incomparable values as non-matching.
+
+    Conditions are reordered for speed, so a range check may see a trade
+    that an earlier-listed condition would already have rejected; it must
+    not raise where the filter as written returns no match.
+
+    Args:
+        compare: Comparison from the operator module (gt, ge, lt or le)
+        expected_value: Operand from the filter
+
+    Returns:
+        Function returning True if the field value satisfies the comparison
+    """
+    def predicate(value: Any) -> bool:
+        if value is None:
+            return False
+        try:
+            return compare(value, expected_value)
+        except TypeError:
+            # e.g. a bool field against a None operand
+            return False
+
+    return predicate
+
+
+def _operator_predicate(operator: str, expected_value: Any) -> Callable[[Any], bool]:
+    """
+    Build the check a single operator applies to a field value.
+
+    Args:
+        operator: Filter operator (already validated)
+        expected_value: Operand from the filter (regex already compiled)
+
+    Returns:
+        Function returning True if the field value satisfies the operator
+    """
+    if operator == "eq":
+        return lambda value: value == expected_value
+    if operator == "ne":
+        return lambda value: value != expected_value
+    if operator in _RANGE_COMPARISONS:
+        return _range_predicate(_RANGE_COMPARISONS[operator], expected_value)
+    if operator == "regex":
+        return lambda value: isinstance(value, str) and expected_value.search(value) is not None
+    if operator == "in":
+        return lambda value: value in expected_value
+    # nin
+    return lambda value: value not in expected_value
+
+
+def _combine_predicates(predicates: List[Callable[[Any], bool]]) -> Callable[[Any], bool]:
+    """
+    Combine the operator checks on one field path with AND logic.
+
+    Args:
+        predicates: Operator checks in evaluation order
+
+    Returns:
+        Function returning True if the field value satisfies every check
+    """
+    if len(predicates) == 1:
+        return predicates[0]
+    return lambda value: all(predicate(value) for predicate in predicates)
+
+
+def _compile_filter(criteria: Dict[str, Any]) -> CompiledFilter:
+    """
+    Validate filter criteria and prepare them for evaluation (uncached).
+
+    Regex patterns and field path accessors are compiled once, and field
+    paths are ordered so the cheapest, most selective operators are
+    evaluated first.
+
+    Args:
+        criteria: Filter criteria keyed by field path
+            (e.g., {"data.trade_type": {"eq": "IR_SWAP"}})
+
+    Returns:
+        Conditions grouped by field path, in evaluation order, and whether
+        the criteria can never match
+
+    Raises:
+        InvalidFilterError: If filter is malformed
+    """
+    compiled: List[FieldConditions] = []
+    never_matches = False
+
+    for field_path, conditions in criteria.items():
+        if not isinstance(conditions, dict):
+            raise InvalidFilterError(f"Filter conditions for '{field_path}' must be a dictionary")
+
+        operators = []
+        for operator, expected_value in conditions.items():
+            if operator not in _OPERATOR_RANK:
+                raise InvalidFilterError(f"Unknown filter operator: {operator}")
+
+            if operator in ("in", "nin"):
+                if not isinstance(expected_value, list):
+                    raise InvalidFilterError(f"'{operator}' operator requires a list, got {type(expected_value)}")
+                # Compiled filters are cached and shared, so keep the operand immutable
+                expected_value = tuple(expected_value)
+
+            if operator == "regex" and not isinstance(expected_value, re.Pattern):
+                try:
+                    expected_value = re.compile(expected_value)
+                except (re.error, TypeError) as e:
+                    raise InvalidFilterError(f"Invalid regex pattern '{expected_value}': {e}")
+
+            operators.append((operator, expected_value))
+
+        operators = tuple(sorted(operators, key=lambda item: _OPERATOR_RANK[item[0]]))
+        predicate = _combine_predicates([_operator_predicate(op, value) for op, value in operators])
+        compiled.append((field_path, compile_path(field_path), operators, predicate))
+
+        # An 'eq' value fixes the field, so the other operators on this path
+        # can be checked against it now
+        if not never_matches and "eq" in conditions:
+            try:
+                never_matches = not predicate(conditions["eq"])
+            except TypeError:
+                # Incomparable operands; leave it to per-trade evaluation
+                pass
+
+    compiled.sort(key=lambda item: min((_OPERATOR_RANK[op] for op, _ in item[2]), default=0))
+    return CompiledFilter(tuple(compiled), never_matches)
+
+
+def _freeze(value: Any) -> Any:
+    """
+    Convert filter criteria into a hashable cache key.
+
+    Types are kept in the key so that, e.g., 1 and 1.0 or True do not share
+    an entry.
+
+    Args:
+        value: Filter criteria or a value inside them
+
+    Returns:
+        Hashable representation of value
+    """
+    if isinstance(value, dict):
+        return (dict, tuple((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, list):
+        return (list, tuple(_freeze(item) for item in value))
+    return (type(value), value)
+
+
+def _thaw(key: Any) -> Any:
+    """
+    Rebuild filter criteria from a key produced by _freeze.
+
+    Args:
+        key: Hashable representation of a value
+
+    Returns:
+        The original value
+    """
+    kind, value = key
+    if kind is dict:
+        return {item_key: _thaw(item) for item_key, item in value}
+    if kind is list:
+        return [_thaw(item) for item in value]
+    return value
+
+
+@lru_cache(maxsize=256)
+def _compile_frozen_filter(key: Any) -> CompiledFilter:
+    """Compile criteria from their frozen form; cached by compile_filter."""
+    return _compile_filter(_thaw(key))
+
+
+def compile_filter(criteria: Dict[str, Any]) -> CompiledFilter:
+    """
+    Validate filter criteria and prepare them for evaluation.
+
+    Results are memoized, so repeating the same filter skips validation and
+    regex compilation. Criteria containing values that cannot be hashed
+    (e.g. sets) are compiled without caching.
+
+    Args:
+        criteria: Filter criteria keyed by field path
+            (e.g., {"data.trade_type": {"eq": "IR_SWAP"}})
+
+    Returns:
+        Conditions grouped by field path, in evaluation order, and whether
+        the criteria can never match
+
+    Raises:
+        InvalidFilterError: If filter is malformed
+    """
+    key = _freeze(criteria)
+    try:
+        hash(key)
+    except TypeError:
+        return _compile_filter(criteria)
+    return _compile_frozen_filter(key)
+
+
 class TradeService:
     """Service layer for trade operations."""
     
@@ -76,6 +359,42 @@ class TradeService:
         
         return trade
     
+    def save_new_batch(self, trades: List[Dict[str, Any]], context: Context) -> List[Dict[str, Any]]:
+        """
+        Save several new trades in one store call.
+        
+        Every trade is checked before any is written, so a rejected batch
+        leaves the store unchanged.
+        
+        Args:
+            trades: Trade data (each must include 'id' field)
+            context: Context metadata
+            
+        Returns:
+            Saved trade data
+            
+        Raises:
+            TradeAlreadyExistsError: If a trade ID already exists or repeats in the batch
+            InvalidContextError: If context is invalid
+        """
+        self._validate_context(context)
+        
+        batch: Dict[str, Dict[str, Any]] = {}
+        for trade in trades:
+            trade_id = trade.get("id")
+            if not trade_id:
+                raise ValueError("Trade must have an 'id' field")
+            
+            if trade_id in batch or self._store.exists(trade_id):
+                raise TradeAlreadyExistsError(f"Trade with ID {trade_id} already exists")
+            
+            batch[trade_id] = trade
+        
+        context_dict = context.model_dump()
+        self._store.save_many(batch, context_dict)
+        
+        return trades
+    
     def save_update(self, trade: Dict[str, Any], context: Context) -> Dict[str, Any]:
         """
         Update an existing trade (full replacement).
@@ -147,48 +466,6 @@ class TradeService:
         context_dict = context.model_dump()
         self._store.delete(trade_id, context_dict)
     
-    def _deep_merge(self, existing: Dict[str, Any], updates: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Deep merge updates into existing data with smart null handling.
-        
-        Rules:
-        - If existing value is a dict and update sets it to null → Remove the field
-        - If existing value is a primitive and update sets it to null → Set to null
-        - Nested dicts are merged recursively
-        - Lists are replaced entirely (not merged)
-        
-        Args:
-            existing: Existing trade data
-            updates: Updates to merge
-            
-        Returns:
-            Merged trade data
-        """
-        result = existing.copy()
-        
-        for key, value in updates.items():
-            if value is None:
-                # Smart null handling
-                if key in result:
-                    existing_value = result[key]
-                    if isinstance(existing_value, dict):
-                        # Remove dict fields when set to null
-                        del result[key]
-                    else:
-                        # Set primitives to null
-                        result[key] = None
-                else:
-                    # Key doesn't exist, set to null
-                    result[key] = None
-            elif isinstance(value, dict) and key in result and isinstance(result[key], dict):
-                # Recursively merge nested dicts
-                result[key] = self._deep_merge(result[key], value)
-            else:
-                # Replace value (including lists)
-                result[key] = value
-        
-        return result
-    
     def save_partial(self, trade_id: str, updates: Dict[str, Any], context: Context) -> Dict[str, Any]:
         """
         Partially update a trade using deep merge.
@@ -213,7 +490,7 @@ class TradeService:
             raise TradeNotFoundError(f"Trade with ID {trade_id} not found")
         
         # Deep merge updates
-        merged_trade = self._deep_merge(existing_trade, updates)
+        merged_trade = deep_merge(existing_trade, updates)
         
         # Save merged trade
         context_dict = context.model_dump()
@@ -221,31 +498,58 @@ class TradeService:
         
         return merged_trade
     
-    def _get_nested_value(self, data: Dict[str, Any], path: str) -> Any:
+    def _candidate_trades(self, compiled: CompiledFilter) -> List[Dict[str, Any]]:
         """
-        Get a value from nested dictionary using dot notation.
+        Narrow the trades a filter has to be checked against.
+        
+        Uses the store's equality index for 'eq' conditions and its range
+        index for gt/gte/lt/lte conditions on indexed paths, keeping the
+        smallest result and stopping early if one is empty; otherwise returns
+        every trade. Candidates still need the full filter applied.
         
         Args:
-            data: Dictionary to search
-            path: Dot-separated path (e.g., "data.leg1.notional")
+            compiled: Filter returned by compile_filter
             
         Returns:
-            Value at the path, or None if path doesn't exist
+            Trades that may match the filter, in store (get_all()) order
         """
-        keys = path.split(".")
-        current = data
-        
-        for key in keys:
-            if isinstance(current, dict) and key in current:
-                current = current[key]
-            else:
-                return None
-        
-        return current
+        best = None
+        for field_path, _, operators, _ in compiled.conditions:
+            lookups = []
+            bounds = {}
+            for operator, expected_value in operators:
+                if operator == "eq":
+                    lookups.append(self._store.find_eq(field_path, expected_value))
+                elif operator in ("gt", "gte") and "lower" not in bounds:
+                    bounds["lower"] = expected_value
+                    bounds["lower_inclusive"] = operator == "gte"
+                elif operator in ("lt", "lte") and "upper" not in bounds:
+                    bounds["upper"] = expected_value
+                    bounds["upper_inclusive"] = operator == "lte"
+            if bounds:
+                lookups.append(self._store.find_range(field_path, **bounds))
+            
+            for candidates in lookups:
+                if candidates is None:
+                    continue
+                if not candidates:
+                    return candidates
+                if best is None or len(candidates) < len(best):
+                    best = candidates
+        
+        return best if best is not None else self._store.get_all()
     
-    def _apply_filter(self, trade: Dict[str, Any], filter_obj: TradeFilter) -> bool:
+    def _select_matching(
+        self,
+        trades: List[Dict[str, Any]],
+        conditions: Tuple[FieldConditions, ...],
+    ) -> List[Dict[str, Any]]:
         """
-        Apply filter to a trade to determine if it matches.
+        Keep the trades that satisfy every compiled filter condition.
+        
+        Conditions are applied one field path at a time over the whole list,
+        narrowing it before the next path is read, instead of walking every
+        condition for each trade.
         
         Supports:
         - Equality operator (eq)
@@ -256,80 +560,18 @@ class TradeService:
         - Multiple conditions with AND logic
         
         Args:
-            trade: Trade data to filter
-            filter_obj: Filter criteria
+            trades: Trades to check
+            conditions: Conditions from a filter returned by compile_filter
             
         Returns:
-            True if trade matches filter, False otherwise
-            
-        Raises:
-            InvalidFilterError: If filter is malformed
+            Matching trades, in the order they were given
         """
-        # If no filter criteria, match all trades
-        if not filter_obj.filter:
-            return True
-        
-        # Apply each filter condition (AND logic)
-        for field_path, conditions in filter_obj.filter.items():
-            if not isinstance(conditions, dict):
-                raise InvalidFilterError(f"Filter conditions for '{field_path}' must be a dictionary")
-            
-            # Get the value from the trade
-            field_value = self._get_nested_value(trade, field_path)
-            
-            # Apply each operator
-            for operator, expected_value in conditions.items():
-                if operator == "eq":
-                    if field_value != expected_value:
-                        return False
-                
-                elif operator == "ne":
-                    if field_value == expected_value:
-                        return False
-                
-                elif operator == "gt":
-                    if field_value is None or not (field_value > expected_value):
-                        return False
-                
-                elif operator == "gte":
-                    if field_value is None or not (field_value >= expected_value):
-                        return False
-                
-                elif operator == "lt":
-                    if field_value is None or not (field_value < expected_value):
-                        return False
-                
-                elif operator == "lte":
-                    if field_value is None or not (field_value <= expected_value):
-                        return False
-                
-                elif operator == "regex":
-                    if field_value is None:
-                        return False
-                    try:
-                        if not isinstance(field_value, str):
-                            return False
-                        if not re.search(expected_value, field_value):
-                            return False
-                    except re.error as e:
-                        raise InvalidFilterError(f"Invalid regex pattern '{expected_value}': {e}")
-                
-                elif operator == "in":
-                    if not isinstance(expected_value, list):
-                        raise InvalidFilterError(f"'in' operator requires a list, got {type(expected_value)}")
-                    if field_value not in expected_value:
-                        return False
-                
-                elif operator == "nin":
-                    if not isinstance(expected_value, list):
-                        raise InvalidFilterError(f"'nin' operator requires a list, got {type(expected_value)}")
-                    if field_value in expected_value:
-                        return False
-                
-                else:
-                    raise InvalidFilterError(f"Unknown filter operator: {operator}")
+        for _, accessor, _, predicate in conditions:
+            if not trades:
+                break
+            trades = [trade for trade in trades if predicate(accessor(trade))]
         
-        return True
+        return trades
     
     def load_by_filter(self, filter_obj: TradeFilter) -> List[Dict[str, Any]]:
         """
@@ -344,14 +586,16 @@ class TradeService:
         Raises:
             InvalidFilterError: If filter is malformed
         """
-        # Get all trades
-        all_trades = self._store.get_all()
+        # Validate the filter once, before touching the store
+        compiled = compile_filter(filter_obj.filter or {})
+        if compiled.never_matches:
+            return []
+        
+        # Get candidate trades (indexed lookup or all trades)
+        candidates = self._candidate_trades(compiled)
         
         # Apply filter
-        matching_trades = [
-            trade for trade in all_trades
-            if self._apply_filter(trade, filter_obj)
-        ]
+        matching_trades = self._select_matching(candidates, compiled.conditions)
         
         return matching_trades
     
@@ -389,11 +633,20 @@ class TradeService:
         Raises:
             InvalidFilterError: If filter is malformed
         """
-        # Get all trades
-        all_trades = self._store.get_all()
+        # Empty filter counts everything, no need to scan
+        if not filter_obj.filter:
+            return self._store.count()
+        
+        # Validate the filter once, before touching the store
+        compiled = compile_filter(filter_obj.filter)
+        if compiled.never_matches:
+            return 0
+        
+        # Get candidate trades (indexed lookup or all trades)
+        candidates = self._candidate_trades(compiled)
         
         # Count matching trades
-        count = sum(1 for trade in all_trades if self._apply_filter(trade, filter_obj))
+        count = len(self._select_matching(candidates, compiled.conditions))
         
         return count
     
@@ -1,8 +1,11 @@
 """In-memory storage implementation with lifecycle tracing."""
 
+import bisect
+import itertools
 import threading
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, TypedDict
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, TypedDict
 
 
 class OperationLog(TypedDict):
@@ -13,14 +16,80 @@ class OperationLog(TypedDict):
     trade_id: str
 
 
+@lru_cache(maxsize=256)
+def compile_path(path: str) -> Callable[[Dict[str, Any]], Any]:
+    """
+    Build an accessor for a dot-separated field path.
+    
+    The path is split once; the returned function walks the keys directly
+    and is cached per path, so repeated filters reuse it.
+    
+    Args:
+        path: Dot-separated path (e.g., "data.leg1.notional")
+        
+    Returns:
+        Function returning the value at the path, or None if it doesn't exist
+    """
+    keys = tuple(path.split("."))
+    
+    def accessor(data: Dict[str, Any]) -> Any:
+        current: Any = data
+        try:
+            for key in keys:
+                current = current[key]
+        except (KeyError, TypeError):
+            return None
+        return current
+    
+    return accessor
+
+
+def _is_number(value: Any) -> bool:
+    """Return True for ints, floats and bools that can be ordered (not NaN)."""
+    return isinstance(value, (int, float)) and value == value
+
+
+def get_nested_value(data: Dict[str, Any], path: str) -> Any:
+    """
+    Get a value from nested dictionary using dot notation.
+    
+    Args:
+        data: Dictionary to search
+        path: Dot-separated path (e.g., "data.leg1.notional")
+        
+    Returns:
+        Value at the path, or None if path doesn't exist
+    """
+    return compile_path(path)(data)
+
+
 class InMemoryStore:
     """Thread-safe in-memory storage for trades with operation logging."""
     
-    def __init__(self):
-        """Initialize the in-memory store."""
+    def __init__(self, indexed_paths: Iterable[str] = ()):
+        """
+        Initialize the in-memory store.
+        
+        Args:
+            indexed_paths: Dot-separated field paths to keep equality and
+                numeric range indexes for (e.g., "data.trade_type").
+                Indexed values are read when a trade is saved, so stored
+                trades must not be mutated in place.
+        """
         self._store: Dict[str, Dict[str, Any]] = {}
         self._operation_log: List[OperationLog] = []
         self._lock = threading.RLock()
+        self._indexed_paths = tuple(indexed_paths)
+        # path -> value -> trade IDs, in store order
+        self._index: Dict[str, Dict[Any, Dict[str, None]]] = {}
+        # path -> (sorted numeric values, trade IDs in the same order)
+        self._range_index: Dict[str, Tuple[List[Any], List[str]]] = {}
+        # trade ID -> path -> value it was indexed under
+        self._indexed_values: Dict[str, Dict[str, Any]] = {}
+        # trade ID -> position in _store order, so index lookups match get_all()
+        self._order: Dict[str, int] = {}
+        self._next_order = itertools.count()
+        self._reset_index()
     
     def save(self, trade_id: str, trade_data: Dict[str, Any], context: Dict[str, str]) -> None:
         """
@@ -32,9 +101,27 @@ class InMemoryStore:
             context: Context metadata (user, agent, action, intent)
         """
         with self._lock:
+            self._unindex(trade_id)
             self._store[trade_id] = trade_data
+            self._index_trade(trade_id, trade_data)
             self._log_operation("save", trade_id, context)
     
+    def save_many(self, trades: Dict[str, Dict[str, Any]], context: Dict[str, str]) -> None:
+        """
+        Save several trades to the store under a single lock acquisition.
+        
+        Args:
+            trades: Trade data keyed by trade ID
+            context: Context metadata (user, agent, action, intent)
+        """
+        with self._lock:
+            for trade_id in trades:
+                self._unindex(trade_id)
+            self._store.update(trades)
+            for trade_id, trade_data in trades.items():
+                self._index_trade(trade_id, trade_data)
+                self._log_operation("save", trade_id, context)
+    
     def get(self, trade_id: str) -> Optional[Dict[str, Any]]:
         """
         Retrieve a trade from the store.
@@ -74,6 +161,8 @@ class InMemoryStore:
         """
         with self._lock:
             if trade_id in self._store:
+                self._unindex(trade_id)
+                self._order.pop(trade_id, None)
                 del self._store[trade_id]
                 self._log_operation("delete", trade_id, context)
                 return True
@@ -89,11 +178,98 @@ class InMemoryStore:
         with self._lock:
             return list(self._store.values())
     
+    def count(self) -> int:
+        """
+        Count the trades in the store.
+        
+        Returns:
+            Number of stored trades
+        """
+        with self._lock:
+            return len(self._store)
+    
+    def find_eq(self, path: str, value: Any) -> Optional[List[Dict[str, Any]]]:
+        """
+        Look up trades whose field at path equals value using the equality index.
+        
+        Args:
+            path: Dot-separated field path
+            value: Value the field must equal
+            
+        Returns:
+            Matching trade data in the same order as get_all(), or None if
+            path is not indexed (the caller should fall back to scanning
+            get_all())
+        """
+        with self._lock:
+            entries = self._index.get(path)
+            if entries is None:
+                return None
+            try:
+                trade_ids = entries.get(value, ())
+            except TypeError:
+                # Unhashable filter value, e.g. a list
+                return None
+            return [self._store[trade_id] for trade_id in trade_ids]
+    
+    def find_range(
+        self,
+        path: str,
+        lower: Any = None,
+        lower_inclusive: bool = True,
+        upper: Any = None,
+        upper_inclusive: bool = True,
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Look up trades whose numeric field at path lies between two bounds.
+        
+        Args:
+            path: Dot-separated field path
+            lower: Lower bound, or None for no lower bound
+            lower_inclusive: Whether a value equal to lower matches
+            upper: Upper bound, or None for no upper bound
+            upper_inclusive: Whether a value equal to upper matches
+            
+        Returns:
+            Matching trade data in the same order as get_all(), or None if
+            path has no usable range index or a bound is not a number (the
+            caller should fall back to scanning get_all())
+        """
+        if lower is not None and not _is_number(lower):
+            return None
+        if upper is not None and not _is_number(upper):
+            return None
+        
+        with self._lock:
+            column = self._range_index.get(path)
+            if column is None:
+                return None
+            sorted_values, trade_ids = column
+            
+            if lower is None:
+                start = 0
+            elif lower_inclusive:
+                start = bisect.bisect_left(sorted_values, lower)
+            else:
+                start = bisect.bisect_right(sorted_values, lower)
+            
+            if upper is None:
+                end = len(sorted_values)
+            elif upper_inclusive:
+                end = bisect.bisect_right(sorted_values, upper)
+            else:
+                end = bisect.bisect_left(sorted_values, upper)
+            
+            # The column is sorted by value; hand matches back in store order
+            matching_ids = sorted(trade_ids[start:end], key=self._order.__getitem__)
+            return [self._store[trade_id] for trade_id in matching_ids]
+    
     def clear(self) -> None:
         """Clear all trades from the store."""
         with self._lock:
             self._store.clear()
             self._operation_log.clear()
+            self._reset_index()
     
     def get_operation_log(self) -> List[OperationLog]:
         """
@@ -105,6 +281,105 @@ class InMemoryStore:
         with self._lock:
             return list(self._operation_log)
     
+    def _reset_index(self) -> None:
+        """Start empty equality and range indexes for every configured path."""
+        self._index = {path: {} for path in self._indexed_paths}
+        self._range_index = {path: ([], []) for path in self._indexed_paths}
+        self._indexed_values = {}
+        self._order = {}
+    
+    def _index_trade(self, trade_id: str, trade_data: Dict[str, Any]) -> None:
+        """
+        Add a trade to the equality and range indexes.
+        
+        Each equality bucket lists its trade IDs in store order. A trade
+        saved for the first time goes to the end; an updated trade keeps its
+        place, as it does in the store.
+        
+        A path whose value is unhashable for any trade is dropped from the
+        equality index, and a path holding anything other than numbers or
+        None is dropped from the range index, until the next clear(). Lookups
+        on a dropped path fall back to a scan.
+        
+        Args:
+            trade_id: Trade ID being indexed
+            trade_data: Trade data being indexed
+        """
+        if not self._indexed_paths:
+            return
+        if trade_id not in self._order:
+            self._order[trade_id] = next(self._next_order)
+        
+        values = {}
+        for path in self._indexed_paths:
+            if path not in self._index and path not in self._range_index:
+                continue
+            value = get_nested_value(trade_data, path)
+            values[path] = value
+            
+            if path in self._index:
+                try:
+                    bucket = self._index[path].setdefault(value, {})
+                except TypeError:
+                    del self._index[path]
+                else:
+                    self._add_to_bucket(bucket, trade_id)
+            
+            if path in self._range_index and value is not None:
+                if _is_number(value):
+                    sorted_values, trade_ids = self._range_index[path]
+                    position = bisect.bisect_right(sorted_values, value)
+                    sorted_values.insert(position, value)
+                    trade_ids.insert(position, trade_id)
+                else:
+                    del self._range_index[path]
+        if values:
+            self._indexed_values[trade_id] = values
+    
+    def _add_to_bucket(self, bucket: Dict[str, None], trade_id: str) -> None:
+        """
+        Add a trade ID to an equality bucket, keeping the bucket in store order.
+        
+        Args:
+            bucket: Trade IDs sharing one indexed value
+            trade_id: Trade ID being indexed
+        """
+        if bucket and self._order[next(reversed(bucket))] > self._order[trade_id]:
+            # An updated trade rejoining a bucket belongs before later trades
+            trade_ids = sorted([*bucket, trade_id], key=self._order.__getitem__)
+            bucket.clear()
+            bucket.update(dict.fromkeys(trade_ids))
+        else:
+            bucket[trade_id] = None
+    
+    def _unindex(self, trade_id: str) -> None:
+        """
+        Remove a stored trade from the equality and range indexes.
+        
+        Args:
+            trade_id: Trade ID being replaced or deleted
+        """
+        values = self._indexed_values.pop(trade_id, {})
+        for path, value in values.items():
+            entries = self._index.get(path)
+            if entries is not None:
+                trade_ids = entries.get(value)
+                if trade_ids is not None:
+                    trade_ids.pop(trade_id, None)
+                    if not trade_ids:
+                        del entries[value]
+            
+            column = self._range_index.get(path)
+            if column is not None and _is_number(value):
+                sorted_values, trade_ids = column
+                start = bisect.bisect_left(sorted_values, value)
+                end = bisect.bisect_right(sorted_values, value)
+                for position in range(start, end):
+                    if trade_ids[position] == trade_id:
+                        del sorted_values[position]
+                        del trade_ids[position]
+                        break
+    
     def _log_operation(self, operation: str, trade_id: str, context: Dict[str, str]) -> None:
         """
         Log an operation with context metadata.
@@ -0,0 +1,69 @@
+"""Cached builders for single-condition TradeFilter objects used in tests."""
+
+from functools import lru_cache
+from typing import Any, Iterable
+
+from tcs_store.models.filter import TradeFilter
+
+
+@lru_cache(maxsize=None, typed=True)
+def _single(field: str, op: str, value: Any) -> TradeFilter:
+    """Build and cache a filter with a single-value operand."""
+    return TradeFilter(filter={field: {op: value}})
+
+
+@lru_cache(maxsize=None)
+def _multi(field: str, op: str, typed_values: tuple) -> TradeFilter:
+    """Build and cache a list-operand filter from (type, value) pairs."""
+    return TradeFilter(filter={field: {op: [value for _, value in typed_values]}})
+
+
+def _build(field: str, op: str, value: Any) -> TradeFilter:
+    """Return a shared filter for hashable values, or a fresh one otherwise."""
+    try:
+        return _single(field, op, value)
+    except TypeError:
+        return TradeFilter(filter={field: {op: value}})
+
+
+def _build_multi(field: str, op: str, values: Iterable[Any]) -> TradeFilter:
+    """Return a shared list-operand filter, or a fresh one if an item is unhashable."""
+    values = list(values)
+    # Keyed on each item's type too, so e.g. [1] and [True] get separate filters
+    try:
+        return _multi(field, op, tuple((type(value), value) for value in values))
+    except TypeError:
+        return TradeFilter(filter={field: {op: values}})
+
+
+def eq(field: str, value: Any) -> TradeFilter:
+    """
+    Return a filter matching trades whose field equals value.
+
+    Filters for hashable values are built once and shared, so callers must
+    not mutate the result. Unhashable values get a fresh filter each call;
+    the other builders below behave the same way.
+
+    Args:
+        field: Dot-separated field path, e.g. "data.type"
+        value: Value to compare against (None matches null or missing fields)
+
+    Returns:
+        TradeFilter with a single eq condition
+    """
+    return _build(field, "eq", value)
+
+
+def ne(field: str, value: Any) -> TradeFilter:
+    """Return a filter matching trades whose field differs from value."""
+    return _build(field, "ne", value)
+
+
+def in_(field: str, values: Iterable[Any]) -> TradeFilter:
+    """Return a filter matching trades whose field is one of values."""
+    return _build_multi(field, "in", values)
+
+
+def nin(field: str, values: Iterable[Any]) -> TradeFilter:
+    """Return a filter matching trades whose field is none of values."""
+    return _build_multi(field, "nin", values)
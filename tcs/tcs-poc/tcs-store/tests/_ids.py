@@ -0,0 +1,11 @@
+"""Unique trade ID helper shared by the property tests."""
+
+import itertools
+
+
+_id_counter = itertools.count()
+
+
+def fast_id() -> str:
+    """Generate a unique trade ID from a process-wide counter."""
+    return f"tid-{next(_id_counter)}"
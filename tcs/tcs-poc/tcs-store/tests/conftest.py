@@ -1,12 +1,96 @@
 """Pytest configuration and fixtures for tcs-store tests."""
 
+import os
+import sys
+from pathlib import Path
+
 import pytest
-from tcs_store.main import store
+from hypothesis import HealthCheck, Phase, settings
+from hypothesis.database import DirectoryBasedExampleDatabase
+
+
+# Hypothesis profiles: "ci" skips the example database and the shrink/explain
+# phases, so runs do no filesystem I/O and failures report the first example
+# found; "dev" keeps the database and all phases for local shrinking and replay.
+# Neither applies a deadline: a slow first request through the app would
+# otherwise be re-run as a flaky example.
+settings.register_profile(
+    "ci",
+    database=None,
+    max_examples=50,
+    deadline=None,
+    suppress_health_check=[HealthCheck.too_slow],
+    phases=[Phase.explicit, Phase.generate],
+)
+settings.register_profile(
+    "dev",
+    database=DirectoryBasedExampleDatabase(".hypothesis/examples"),
+    deadline=None,
+    suppress_health_check=[HealthCheck.too_slow],
+)
+settings.load_profile(os.getenv("HYPOTHESIS_PROFILE", "ci"))
+
+
+@pytest.fixture(scope="session")
+def storage_backend():
+    """Expose the app's in-memory store for direct setup and inspection."""
+    from tcs_store.main import store
+    
+    return store
+
+
+@pytest.fixture(scope="session")
+def preload(storage_backend):
+    """Return a helper that inserts a trade straight into the store, bypassing HTTP."""
+    def _preload(context, trade):
+        storage_backend.save(trade["id"], trade, context)
+    return _preload
+
+
+_UNIT_TESTS_DIR = Path(__file__).parent / "unit"
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_auto_num_workers(config):
+    """
+    Run selections made only of unit tests in-process under -n auto.
+    
+    The unit tests finish faster than xdist can start its workers, so
+    spawning them only adds latency. Any other selection falls through to
+    xdist's default of one worker per CPU.
+    """
+    root = config.invocation_params.dir
+    paths = [(root / arg.split("::")[0]).resolve() for arg in config.args]
+    if paths and all(path == _UNIT_TESTS_DIR or _UNIT_TESTS_DIR in path.parents for path in paths):
+        return 0
+    return None
+
+
+def _clear_app_store():
+    """Clear the app's store, if the app has been imported at all."""
+    main = sys.modules.get("tcs_store.main")
+    if main is not None:
+        main.store.clear()
 
 
 @pytest.fixture(autouse=True)
 def clear_store():
-    """Clear the in-memory store before each test."""
-    store.clear()
+    """
+    Clear the in-memory store before and after each test.
+    
+    The app is imported lazily, so runs that only touch the service layer
+    never build the FastAPI app.
+    """
+    _clear_app_store()
     yield
-    store.clear()
+    _clear_app_store()
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Share one TestClient, and one app lifespan, across the test session."""
+    from fastapi.testclient import TestClient
+    from tcs_store.main import app
+    
+    with TestClient(app) as test_client:
+        yield test_client
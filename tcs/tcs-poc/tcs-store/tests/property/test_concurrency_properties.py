@@ -6,17 +6,20 @@ from hypothesis import given, settings
 import hypothesis.strategies as st
 
 from tcs_store.storage.in_memory_store import InMemoryStore
+from tests._ids import fast_id
+
+
+# Shared trade payload; only the ID varies between generated trades and
+# the tests never mutate it.
+_TRADE_DATA = {
+    "trade_type": "IR_SWAP",
+    "notional": 1000000,
+}
 
 
 def generate_trade_data():
     """Generate random trade data."""
-    return {
-        "id": str(uuid.uuid4()),
-        "data": {
-            "trade_type": "IR_SWAP",
-            "notional": 1000000,
-        }
-    }
+    return {"id": fast_id(), "data": _TRADE_DATA}
 
 
 def generate_context():
@@ -53,8 +56,7 @@ def test_concurrent_save_operations(num_trades, num_workers):
     
     # Execute concurrent saves
     with ThreadPoolExecutor(max_workers=num_workers) as executor:
-        futures = [executor.submit(save_trade, trade) for trade in trades]
-        saved_ids = [f.result() for f in as_completed(futures)]
+        saved_ids = list(executor.map(save_trade, trades))
     
     # Verify all trades were saved
     assert len(saved_ids) == num_trades
@@ -112,7 +114,7 @@ def test_concurrent_mixed_operations(num_trades, num_workers):
     # Execute concurrent mixed operations
     with ThreadPoolExecutor(max_workers=num_workers) as executor:
         futures = [executor.submit(mixed_operation, i) for i in range(num_trades)]
-        results = [f.result() for f in as_completed(futures)]
+        results = [f.result() for f in futures]
     
     # Verify no exceptions occurred and all operations completed
     assert len(results) == num_trades
@@ -141,7 +143,7 @@ def test_concurrent_read_write_consistency(num_operations):
     a corrupted or partial value.
     """
     store = InMemoryStore()
-    trade_id = str(uuid.uuid4())
+    trade_id = fast_id()
     
     # Initial save
     initial_trade = {"id": trade_id, "data": {"version": 0}}
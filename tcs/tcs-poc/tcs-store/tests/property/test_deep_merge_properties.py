@@ -5,8 +5,14 @@ from hypothesis import given, settings, assume
 import hypothesis.strategies as st
 
 from tcs_store.storage.in_memory_store import InMemoryStore
-from tcs_store.services.trade_service import TradeService
+from tcs_store.services.trade_service import TradeService, deep_merge
 from tcs_store.models import Context
+from tests._ids import fast_id
+
+
+# Field names carry no meaning for merge semantics (other than "id"), so
+# draw them from a small fixed pool instead of arbitrary Unicode text.
+SAFE_FIELDS = st.sampled_from(["a", "b", "field", "x", "y", "value", "nested", "data"])
 
 
 def generate_context():
@@ -22,13 +28,13 @@ def generate_context():
 # Feature: tcs-store, Property 4: Deep Merge Preservation
 @given(
     initial_fields=st.dictionaries(
-        st.text(min_size=1, max_size=20).filter(lambda x: x != "id"),
+        SAFE_FIELDS,
         st.one_of(st.text(), st.integers(), st.booleans()),
         min_size=2,
         max_size=10
     ),
     update_fields=st.dictionaries(
-        st.text(min_size=1, max_size=20).filter(lambda x: x != "id"),
+        SAFE_FIELDS,
         st.one_of(st.text(), st.integers(), st.booleans()),
         min_size=1,
         max_size=5
@@ -47,7 +53,7 @@ def test_deep_merge_preserves_unmentioned_fields(initial_fields, update_fields):
     context = generate_context()
     
     # Create initial trade
-    trade_id = str(uuid.uuid4())
+    trade_id = fast_id()
     initial_trade = {"id": trade_id, **initial_fields}
     service.save_new(initial_trade, context)
     
@@ -65,7 +71,7 @@ def test_deep_merge_preserves_unmentioned_fields(initial_fields, update_fields):
 @given(
     initial_value=st.one_of(st.text(), st.integers(), st.booleans()),
     update_value=st.one_of(st.text(), st.integers(), st.booleans()),
-    field_name=st.text(min_size=1, max_size=20).filter(lambda x: x != "id")
+    field_name=SAFE_FIELDS
 )
 @settings(max_examples=100)
 def test_deep_merge_overrides_mentioned_fields(initial_value, update_value, field_name):
@@ -75,18 +81,13 @@ def test_deep_merge_overrides_mentioned_fields(initial_value, update_value, fiel
     For any field that exists in both the existing trade and the update,
     the update value should win.
     """
-    store = InMemoryStore()
-    service = TradeService(store)
-    context = generate_context()
-    
     # Create initial trade
-    trade_id = str(uuid.uuid4())
+    trade_id = fast_id()
     initial_trade = {"id": trade_id, field_name: initial_value}
-    service.save_new(initial_trade, context)
     
     # Partial update with same field
     updates = {field_name: update_value}
-    updated_trade = service.save_partial(trade_id, updates, context)
+    updated_trade = deep_merge(initial_trade, updates)
     
     # Verify field was overridden
     assert updated_trade[field_name] == update_value
@@ -95,12 +96,12 @@ def test_deep_merge_overrides_mentioned_fields(initial_value, update_value, fiel
 # Feature: tcs-store, Property 4: Deep Merge Preservation
 @given(
     nested_dict=st.dictionaries(
-        st.text(min_size=1, max_size=10),
+        SAFE_FIELDS,
         st.one_of(st.text(), st.integers()),
         min_size=2,
         max_size=5
     ),
-    update_key=st.text(min_size=1, max_size=10),
+    update_key=SAFE_FIELDS,
     update_value=st.one_of(st.text(), st.integers())
 )
 @settings(max_examples=100)
@@ -111,21 +112,16 @@ def test_deep_merge_nested_dict_preservation(nested_dict, update_key, update_val
     For nested objects, updating one field should preserve other fields
     in the same nested object.
     """
-    store = InMemoryStore()
-    service = TradeService(store)
-    context = generate_context()
-    
     # Create initial trade with nested data
-    trade_id = str(uuid.uuid4())
+    trade_id = fast_id()
     initial_trade = {
         "id": trade_id,
         "data": nested_dict.copy()
     }
-    service.save_new(initial_trade, context)
     
     # Partial update of nested field
     updates = {"data": {update_key: update_value}}
-    updated_trade = service.save_partial(trade_id, updates, context)
+    updated_trade = deep_merge(initial_trade, updates)
     
     # Verify nested field was updated
     assert updated_trade["data"][update_key] == update_value
@@ -139,9 +135,9 @@ def test_deep_merge_nested_dict_preservation(nested_dict, update_key, update_val
 
 # Feature: tcs-store, Property 4: Deep Merge Preservation
 @given(
-    dict_field_name=st.text(min_size=1, max_size=20).filter(lambda x: x != "id"),
+    dict_field_name=SAFE_FIELDS,
     dict_content=st.dictionaries(
-        st.text(min_size=1, max_size=10),
+        SAFE_FIELDS,
         st.one_of(st.text(), st.integers()),
         min_size=1,
         max_size=5
@@ -155,22 +151,17 @@ def test_deep_merge_null_removes_dict_fields(dict_field_name, dict_content):
     For nested objects set to null, if the existing value is an object,
     the field should be removed entirely.
     """
-    store = InMemoryStore()
-    service = TradeService(store)
-    context = generate_context()
-    
     # Create initial trade with dict field
-    trade_id = str(uuid.uuid4())
+    trade_id = fast_id()
     initial_trade = {
         "id": trade_id,
         dict_field_name: dict_content,
         "other_field": "preserved"
     }
-    service.save_new(initial_trade, context)
     
     # Set dict field to null
     updates = {dict_field_name: None}
-    updated_trade = service.save_partial(trade_id, updates, context)
+    updated_trade = deep_merge(initial_trade, updates)
     
     # Verify dict field was removed
     assert dict_field_name not in updated_trade
@@ -181,7 +172,7 @@ def test_deep_merge_null_removes_dict_fields(dict_field_name, dict_content):
 
 # Feature: tcs-store, Property 4: Deep Merge Preservation
 @given(
-    primitive_field_name=st.text(min_size=1, max_size=20).filter(lambda x: x != "id"),
+    primitive_field_name=SAFE_FIELDS,
     primitive_value=st.one_of(st.text(), st.integers(), st.booleans())
 )
 @settings(max_examples=100)
@@ -191,22 +182,17 @@ def test_deep_merge_null_sets_primitive_to_null(primitive_field_name, primitive_
     
     For primitives set to null, the field should remain but with null value.
     """
-    store = InMemoryStore()
-    service = TradeService(store)
-    context = generate_context()
-    
     # Create initial trade with primitive field
-    trade_id = str(uuid.uuid4())
+    trade_id = fast_id()
     initial_trade = {
         "id": trade_id,
         primitive_field_name: primitive_value,
         "other_field": "preserved"
     }
-    service.save_new(initial_trade, context)
     
     # Set primitive field to null
     updates = {primitive_field_name: None}
-    updated_trade = service.save_partial(trade_id, updates, context)
+    updated_trade = deep_merge(initial_trade, updates)
     
     # Verify primitive field is null
     assert primitive_field_name in updated_trade
@@ -229,21 +215,16 @@ def test_deep_merge_replaces_lists(list_content, new_list_content):
     For list fields, the entire list should be replaced with the new list,
     not merged element by element.
     """
-    store = InMemoryStore()
-    service = TradeService(store)
-    context = generate_context()
-    
     # Create initial trade with list
-    trade_id = str(uuid.uuid4())
+    trade_id = fast_id()
     initial_trade = {
         "id": trade_id,
         "items": list_content
     }
-    service.save_new(initial_trade, context)
     
     # Update list
     updates = {"items": new_list_content}
-    updated_trade = service.save_partial(trade_id, updates, context)
+    updated_trade = deep_merge(initial_trade, updates)
     
     # Verify list was replaced (equals new list)
     assert updated_trade["items"] == new_list_content
@@ -1,170 +1,166 @@
 """Property-based tests for error handling."""
 
+import asyncio
+import json
+import os
+import string
+
+import httpx
 import pytest
 from hypothesis import given, settings
 import hypothesis.strategies as st
-from fastapi.testclient import TestClient
 
-from tcs_store.main import app
 
-client = TestClient(app)
+@pytest.fixture(scope="module")
+def module_loop():
+    """
+    Provide one event loop for the whole module.
+    
+    Requests run on the ASGI app directly instead of through TestClient's
+    per-call thread portal. The loop is only created when a test needs it.
+    """
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
 
 
-# Strategy for generating valid context
-@st.composite
-def context_strategy(draw):
-    """Generate valid context metadata."""
-    # Generate strings with only printable ASCII characters (no control chars, no extended ASCII)
-    return {
-        "user": draw(st.text(min_size=1, max_size=50, alphabet=st.characters(min_codepoint=33, max_codepoint=126))),
-        "agent": draw(st.text(min_size=1, max_size=50, alphabet=st.characters(min_codepoint=33, max_codepoint=126))),
-        "action": draw(st.text(min_size=1, max_size=50, alphabet=st.characters(min_codepoint=33, max_codepoint=126))),
-        "intent": draw(st.text(min_size=1, max_size=50, alphabet=st.characters(min_codepoint=33, max_codepoint=126))),
-    }
+@pytest.fixture(scope="module")
+def async_client(module_loop):
+    """Create an httpx client that calls the ASGI app in-process."""
+    from tcs_store.main import app
+    
+    client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+    yield client
+    module_loop.run_until_complete(client.aclose())
 
 
-# Strategy for generating trade IDs
-trade_id_strategy = st.text(min_size=1, max_size=100, alphabet=st.characters(
-    whitelist_categories=("Lu", "Ll", "Nd"),
-    whitelist_characters="-_"
-))
+def post_sync(loop, client, path, **kwargs):
+    """Send a POST request through the async client and wait for the response."""
+    return loop.run_until_complete(client.post(path, **kwargs))
 
 
-# Feature: tcs-store, Property 18: Error Response Format
-@given(trade_id=trade_id_strategy, context=context_strategy())
-@settings(max_examples=100)
-def test_error_response_format_not_found(trade_id, context):
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def _has_key(response, key):
+    """Check the raw response body for a JSON key without decoding it."""
+    return f'"{key}":'.encode() in response.content
+
+
+def _assert_error_shape(response, status_code, require_error=False):
     """
-    Property 18: Error Response Format
-    
-    For any error condition, the response should be valid JSON containing
-    an error message and the appropriate HTTP status code.
-    
-    This test verifies that 404 errors have the correct format.
+    Assert a response has the expected status code and a well-formed error body.
     
-    Validates: Requirements 13.1
+    FastAPI validation errors carry "detail" (list or string); our custom
+    exception handlers carry a non-empty "error" string and a "detail" string.
+    Pass require_error=True when the response must come from a custom handler.
     """
-    # Try to load a non-existent trade
-    response = client.post(
-        "/load/id",
-        json={"context": context, "id": trade_id}
-    )
-    
-    # Should return 404
-    assert response.status_code == 404
-    
-    # Response should be valid JSON
+    assert response.status_code == status_code
     data = response.json()
     
-    # Should have error field
-    assert "error" in data
-    assert isinstance(data["error"], str)
-    assert len(data["error"]) > 0
+    if require_error:
+        assert "error" in data
+    else:
+        assert "detail" in data or "error" in data
     
-    # May have detail field
+    if "error" in data:
+        assert isinstance(data["error"], str) and data["error"]
     if "detail" in data:
-        assert isinstance(data["detail"], str)
+        assert data["detail"] is not None
+        if require_error:
+            assert isinstance(data["detail"], str)
+
+
+# Strategy for generating valid context. The fields are independent, so a
+# fixed_dictionaries draw is enough; the error paths never depend on content.
+_context_field_strategy = st.text(min_size=1, max_size=8, alphabet=string.ascii_letters)
+
+CONTEXT_STRATEGY = st.fixed_dictionaries({
+    "user": _context_field_strategy,
+    "agent": _context_field_strategy,
+    "action": _context_field_strategy,
+    "intent": _context_field_strategy,
+})
 
 
+# Strategy for generating trade IDs. Short ASCII IDs by default; set
+# HYPOTHESIS_THOROUGH for the full Unicode letter/digit space (nightly runs).
+_TRADE_ID_ALPHABET = string.ascii_letters + string.digits + "-_"
+
+if os.getenv("HYPOTHESIS_THOROUGH"):
+    TRADE_ID_STRATEGY = st.text(min_size=1, max_size=100, alphabet=st.characters(
+        whitelist_categories=("Lu", "Ll", "Nd"),
+        whitelist_characters="-_"
+    ))
+else:
+    TRADE_ID_STRATEGY = st.text(min_size=1, max_size=16, alphabet=_TRADE_ID_ALPHABET)
+
+
+# The update not-found paths only look the ID up, so a tiny fixed pool of
+# missing IDs and a static context cover them.
+MISSING_TRADE_IDS = st.sampled_from(["missing-a", "missing-b", "missing-c"])
+
+FIXED_CONTEXT = {"user": "u", "agent": "a", "action": "x", "intent": "i"}
+
+
+# Feature: tcs-store, Property 16: Not Found Errors
 # Feature: tcs-store, Property 18: Error Response Format
-@given(context=context_strategy(), trade_id=trade_id_strategy)
-@settings(max_examples=100)
-def test_error_response_format_conflict(context, trade_id):
+@given(trade_id=TRADE_ID_STRATEGY, context=CONTEXT_STRATEGY)
+@settings(max_examples=20)
+def test_error_response_format_not_found(module_loop, async_client, trade_id, context):
     """
+    Property 16: Not Found Errors
     Property 18: Error Response Format
     
     For any error condition, the response should be valid JSON containing
     an error message and the appropriate HTTP status code.
     
-    This test verifies that 409 errors have the correct format.
+    This test verifies that loading a non-existent trade returns 404 with
+    the correct error format.
     
-    Validates: Requirements 13.1
+    Validates: Requirements 4.2, 13.1
     """
-    # Create a trade with unique ID
-    trade = {"id": trade_id, "data": {"test": "data"}}
-    
-    response = client.post(
-        "/save/new",
-        json={"context": context, "trade": trade}
-    )
-    
-    # If trade already exists (from previous example), delete it first
-    if response.status_code == 409:
-        client.post("/delete/id", json={"context": context, "id": trade_id})
-        response = client.post(
-            "/save/new",
-            json={"context": context, "trade": trade}
-        )
-    
-    assert response.status_code == 201
-    
-    # Try to create the same trade again
-    response = client.post(
-        "/save/new",
-        json={"context": context, "trade": trade}
+    # Try to load a non-existent trade
+    response = post_sync(
+        module_loop,
+        async_client,
+        "/load/id",
+        json={"context": context, "id": trade_id}
     )
     
-    # Should return 409
-    assert response.status_code == 409
-    
-    # Response should be valid JSON
-    data = response.json()
-    
-    # Should have error field
-    assert "error" in data
-    assert isinstance(data["error"], str)
-    assert len(data["error"]) > 0
-    
-    # May have detail field
-    if "detail" in data:
-        assert isinstance(data["detail"], str)
+    # Should return 404 with the custom handler's error body
+    _assert_error_shape(response, 404, require_error=True)
 
 
 # Feature: tcs-store, Property 18: Error Response Format
-@given(trade_id=trade_id_strategy)
+@given(context=CONTEXT_STRATEGY, trade_id=st.uuids().map(str))
 @settings(max_examples=100)
-def test_error_response_format_validation(trade_id):
+def test_error_response_format_conflict(module_loop, async_client, preload, context, trade_id):
     """
     Property 18: Error Response Format
     
     For any error condition, the response should be valid JSON containing
     an error message and the appropriate HTTP status code.
     
-    This test verifies that 422 validation errors have the correct format.
+    This test verifies that 409 errors have the correct format.
     
     Validates: Requirements 13.1
     """
-    # Try to save without context (should fail validation)
-    response = client.post(
-        "/save/new",
-        json={"trade": {"id": trade_id, "data": {}}}
-    )
-    
-    # Should return 422
-    assert response.status_code == 422
-    
-    # Response should be valid JSON
-    data = response.json()
+    # Put the trade in the store directly, then try to create it again
+    trade = {"id": trade_id, "data": {"test": "data"}}
+    preload(context, trade)
     
-    # FastAPI validation errors have "detail" field (may be list or string)
-    # Our custom exception handlers have "error" field
-    # Both are valid error response formats
-    assert "detail" in data or "error" in data
+    body = json.dumps({"context": context, "trade": trade})
+    response = post_sync(module_loop, async_client, "/save/new", content=body, headers=_JSON_HEADERS)
     
-    if "detail" in data:
-        # FastAPI validation error format
-        assert data["detail"] is not None
-    if "error" in data:
-        # Custom exception handler format
-        assert isinstance(data["error"], str)
-        assert len(data["error"]) > 0
-
+    # Should return 409 with the custom handler's error body
+    _assert_error_shape(response, 409, require_error=True)
 
 
 # Feature: tcs-store, Property 16: Not Found Errors
-@given(trade_id=trade_id_strategy, context=context_strategy())
-@settings(max_examples=100)
-def test_not_found_errors_update(trade_id, context):
+@given(trade_id=MISSING_TRADE_IDS)
+@settings(max_examples=20)
+def test_not_found_errors_update(module_loop, async_client, trade_id):
     """
     Property 16: Not Found Errors
     
@@ -176,10 +172,12 @@ def test_not_found_errors_update(trade_id, context):
     Validates: Requirements 2.2, 3.2, 4.2
     """
     # Try to update a non-existent trade
-    response = client.post(
+    response = post_sync(
+        module_loop,
+        async_client,
         "/save/update",
         json={
-            "context": context,
+            "context": FIXED_CONTEXT,
             "trade": {"id": trade_id, "data": {"test": "data"}}
         }
     )
@@ -188,14 +186,13 @@ def test_not_found_errors_update(trade_id, context):
     assert response.status_code == 404
     
     # Response should contain error information
-    data = response.json()
-    assert "detail" in data or "error" in data
+    assert _has_key(response, "detail") or _has_key(response, "error")
 
 
 # Feature: tcs-store, Property 16: Not Found Errors
-@given(trade_id=trade_id_strategy, context=context_strategy())
-@settings(max_examples=100)
-def test_not_found_errors_partial_update(trade_id, context):
+@given(trade_id=MISSING_TRADE_IDS)
+@settings(max_examples=20)
+def test_not_found_errors_partial_update(module_loop, async_client, trade_id):
     """
     Property 16: Not Found Errors
     
@@ -207,10 +204,12 @@ def test_not_found_errors_partial_update(trade_id, context):
     Validates: Requirements 2.2, 3.2, 4.2
     """
     # Try to partially update a non-existent trade
-    response = client.post(
+    response = post_sync(
+        module_loop,
+        async_client,
         "/save/partial",
         json={
-            "context": context,
+            "context": FIXED_CONTEXT,
             "id": trade_id,
             "updates": {"data": {"field": "value"}}
         }
@@ -220,125 +219,47 @@ def test_not_found_errors_partial_update(trade_id, context):
     assert response.status_code == 404
     
     # Response should contain error information
-    data = response.json()
-    assert "detail" in data or "error" in data
+    assert _has_key(response, "detail") or _has_key(response, "error")
 
 
-# Feature: tcs-store, Property 16: Not Found Errors
-@given(trade_id=trade_id_strategy, context=context_strategy())
-@settings(max_examples=100)
-def test_not_found_errors_load(trade_id, context):
-    """
-    Property 16: Not Found Errors
-    
-    For any operation that references a non-existent trade ID (update, partial update, load),
-    the operation should fail with HTTP status 404 and an appropriate error message.
-    
-    This test verifies that load operations return 404 for non-existent trades.
-    
-    Validates: Requirements 2.2, 3.2, 4.2
-    """
-    # Try to load a non-existent trade
-    response = client.post(
-        "/load/id",
-        json={"context": context, "id": trade_id}
-    )
-    
-    # Should return 404
-    assert response.status_code == 404
-    
-    # Response should contain error information
-    data = response.json()
-    assert "detail" in data or "error" in data
-
-
-
-# Feature: tcs-store, Property 17: Validation Errors
-@given(trade_id=trade_id_strategy)
-@settings(max_examples=100)
-def test_validation_errors_missing_context(trade_id):
-    """
-    Property 17: Validation Errors
-    
-    For any request with invalid JSON structure or missing required fields,
-    the operation should fail with HTTP status 422 and detailed error information.
-    
-    This test verifies that requests without context are rejected with 422.
-    
-    Validates: Requirements 1.3, 2.3, 6.3, 7.3, 8.3, 11.2
-    """
-    # Try to save without context
-    response = client.post(
-        "/save/new",
-        json={"trade": {"id": trade_id, "data": {}}}
-    )
-    
-    # Should return 422
-    assert response.status_code == 422
-    
-    # Response should contain error information
-    data = response.json()
-    assert "detail" in data or "error" in data
+# Malformed payloads for the validation property: (path, payload factory)
+VALIDATION_ERROR_CASES = [
+    # Missing context
+    ("/save/new", lambda trade_id, context: {"trade": {"id": trade_id, "data": {}}}),
+    # Missing trade ID
+    ("/save/new", lambda trade_id, context: {"context": context, "trade": {"data": {"test": "data"}}}),
+    # Empty ID list
+    ("/load/group", lambda trade_id, context: {"context": context, "ids": []}),
+]
 
 
 # Feature: tcs-store, Property 17: Validation Errors
-@given(context=context_strategy())
-@settings(max_examples=100)
-def test_validation_errors_missing_trade_id(context):
-    """
-    Property 17: Validation Errors
-    
-    For any request with invalid JSON structure or missing required fields,
-    the operation should fail with HTTP status 422 and detailed error information.
-    
-    This test verifies that requests without trade ID are rejected with 422.
-    
-    Validates: Requirements 1.3, 2.3, 6.3, 7.3, 8.3, 11.2
-    """
-    # Try to save without trade ID
-    response = client.post(
-        "/save/new",
-        json={"context": context, "trade": {"data": {"test": "data"}}}
-    )
-    
-    # Should return 422
-    assert response.status_code == 422
-    
-    # Response should contain error information
-    data = response.json()
-    assert "detail" in data or "error" in data
-
-
-# Feature: tcs-store, Property 17: Validation Errors
-@given(context=context_strategy())
-@settings(max_examples=100)
-def test_validation_errors_empty_id_list(context):
+# Feature: tcs-store, Property 18: Error Response Format
+@pytest.mark.parametrize("path,payload_factory", VALIDATION_ERROR_CASES)
+@given(trade_id=TRADE_ID_STRATEGY, context=CONTEXT_STRATEGY)
+@settings(max_examples=20)
+def test_validation_errors(module_loop, async_client, path, payload_factory, trade_id, context):
     """
     Property 17: Validation Errors
+    Property 18: Error Response Format
     
     For any request with invalid JSON structure or missing required fields,
-    the operation should fail with HTTP status 422 and detailed error information.
+    the operation should fail with HTTP status 422 and an error response
+    in one of the two supported formats.
     
-    This test verifies that requests with empty ID lists are rejected with 422.
+    This test covers requests without context, without a trade ID, and
+    with an empty ID list.
     
-    Validates: Requirements 1.3, 2.3, 6.3, 7.3, 8.3, 11.2
+    Validates: Requirements 1.3, 2.3, 6.3, 7.3, 8.3, 11.2, 13.1
     """
-    # Try to load with empty ID list
-    response = client.post(
-        "/load/group",
-        json={"context": context, "ids": []}
-    )
+    response = post_sync(module_loop, async_client, path, json=payload_factory(trade_id, context))
     
-    # Should return 422
-    assert response.status_code == 422
-    
-    # Response should contain error information
-    data = response.json()
-    assert "detail" in data or "error" in data
+    # Should return 422 in either error response format
+    _assert_error_shape(response, 422)
 
 
 # Feature: tcs-store, Property 17: Validation Errors
-def test_validation_errors_invalid_json():
+def test_validation_errors_invalid_json(module_loop, async_client):
     """
     Property 17: Validation Errors
     
@@ -350,15 +271,16 @@ def test_validation_errors_invalid_json():
     Validates: Requirements 1.3, 2.3, 6.3, 7.3, 8.3, 11.2
     """
     # Try to send invalid JSON
-    response = client.post(
+    response = post_sync(
+        module_loop,
+        async_client,
         "/save/new",
-        data="not valid json",
-        headers={"Content-Type": "application/json"}
+        content="not valid json",
+        headers=_JSON_HEADERS
     )
     
     # Should return 422
     assert response.status_code == 422
     
     # Response should contain error information
-    data = response.json()
-    assert "detail" in data or "error" in data
+    assert _has_key(response, "detail") or _has_key(response, "error")
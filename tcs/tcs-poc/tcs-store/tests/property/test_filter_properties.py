@@ -1,6 +1,9 @@
 """Property-based tests for filter operations."""
 
-import uuid
+import itertools
+import re
+from operator import itemgetter
+import pytest
 from hypothesis import given, settings, assume
 import hypothesis.strategies as st
 
@@ -10,23 +13,116 @@ from tcs_store.models import Context
 from tcs_store.models.filter import TradeFilter
 
 
+_context_counter = itertools.count()
+
+
 def generate_context():
-    """Generate a valid context."""
+    """Generate a valid context with a unique user from a counter."""
     return Context(
-        user=f"user_{uuid.uuid4().hex[:8]}",
+        user=f"user_{next(_context_counter):08x}",
         agent="test_agent",
         action="test_action",
         intent="test_intent"
     )
 
 
+# IDs only need to be unique within one example because the store is
+# cleared before each one, so a fixed pool replaces per-trade uuid4 calls.
+_ID_POOL = [f"{i:032x}" for i in range(64)]
+_CTX = generate_context()
+
+# Filter values covering empty, ASCII, non-ASCII, max-length, numeric-looking
+# and whitespace-only strings
+_FILTER_VALUES = ["BANK_A", "", "SWAP", "αβγ", "x" * 20, "123", "\n\t"]
+
+_get_id = itemgetter("id")
+
+# Filters whose shape is fixed across examples are validated once here and
+# copied per example; model_copy does not re-run validation
+_STATUS_FILTER_TEMPLATE = TradeFilter(filter={"data.status": {"eq": ""}})
+_SWAP_AMOUNT_FILTER_TEMPLATE = TradeFilter(
+    filter={
+        "data.type": {"eq": "SWAP"},
+        "data.amount": {"gte": 0, "lte": 0}
+    }
+)
+
+_BANK_RE = re.compile("^BANK.*")
+_UPPER_RE = re.compile("^UPPER.*")
+
+
+# Bit i stands for _ID_POOL[i], so a set of trades is a single int mask
+_ID_BIT = {trade_id: 1 << i for i, trade_id in enumerate(_ID_POOL)}
+
+
+def _assert_matches(results, matching_mask):
+    """Assert results hold exactly the trades whose bits are set in matching_mask."""
+    result_mask = 0
+    for trade in results:
+        result_mask |= _ID_BIT[trade["id"]]
+    assert result_mask == matching_mask
+    assert len(results) == bin(matching_mask).count("1")
+
+
+@pytest.fixture(scope="module")
+def store():
+    """
+    Provide one in-memory store shared by every example in this module.
+    
+    Each pytest-xdist worker builds its own copy and every test clears it
+    first, so the tests can be spread across workers individually.
+    """
+    return InMemoryStore(
+        indexed_paths=(
+            "data.trade_type",
+            "data.test_field",
+            "data.category",
+            "data.type",
+            "data.amount",
+            "data.value",
+        )
+    )
+
+
+@pytest.fixture(scope="module")
+def service(store):
+    """Provide a trade service bound to the shared store."""
+    return TradeService(store)
+
+
+@pytest.fixture(scope="module")
+def category_services():
+    """
+    Return a function giving a service over num_trades CAT_i trades.
+    
+    Each size is populated once on first use and then shared, so tests
+    using it must only read from the returned service.
+    """
+    services = {}
+    
+    def get(num_trades):
+        if num_trades not in services:
+            service = TradeService(InMemoryStore(indexed_paths=("data.category",)))
+            service.save_new_batch(
+                [
+                    {"id": _ID_POOL[i], "data": {"category": f"CAT_{i}"}}
+                    for i in range(num_trades)
+                ],
+                _CTX
+            )
+            services[num_trades] = service
+        return services[num_trades]
+    
+    return get
+
+
 # Feature: tcs-store, Property 9: Filter Correctness
 @given(
     num_trades=st.integers(min_value=5, max_value=20),
-    filter_value=st.text(min_size=1, max_size=20)
+    filter_value=st.sampled_from(_FILTER_VALUES)
 )
 @settings(max_examples=100)
-def test_filter_correctness(num_trades, filter_value):
+def test_filter_correctness(store, service, num_trades, filter_value):
     """
     Test filter correctness property.
     
@@ -34,16 +130,15 @@ def test_filter_correctness(num_trades, filter_value):
     calling load_by_filter should return all and only the trades
     that match the filter criteria according to the filter evaluation logic.
     """
-    store = InMemoryStore()
-    service = TradeService(store)
-    context = generate_context()
+    store.clear()
+    context = _CTX
     
     # Create trades with known values
-    matching_trades = []
-    non_matching_trades = []
+    matching_mask = 0
     
+    batch = []
     for i in range(num_trades):
-        trade_id = str(uuid.uuid4())
+        trade_id = _ID_POOL[i]
         
         # Half the trades match the filter, half don't
         if i % 2 == 0:
@@ -54,7 +149,7 @@ def test_filter_correctness(num_trades, filter_value):
                     "index": i
                 }
             }
-            matching_trades.append(trade)
+            matching_mask |= 1 << i
         else:
             trade = {
                 "id": trade_id,
@@ -63,9 +158,10 @@ def test_filter_correctness(num_trades, filter_value):
                     "index": i
                 }
             }
-            non_matching_trades.append(trade)
         
-        service.save_new(trade, context)
+        batch.append(trade)
+    
+    service.save_new_batch(batch, context)
     
     # Apply filter
     filter_obj = TradeFilter(
@@ -74,42 +170,33 @@ def test_filter_correctness(num_trades, filter_value):
     
     results = service.load_by_filter(filter_obj)
     
-    # Verify all matching trades are returned
-    result_ids = {t["id"] for t in results}
-    expected_ids = {t["id"] for t in matching_trades}
-    
-    assert result_ids == expected_ids
-    assert len(results) == len(matching_trades)
-    
-    # Verify no non-matching trades are returned
-    non_matching_ids = {t["id"] for t in non_matching_trades}
-    assert result_ids.isdisjoint(non_matching_ids)
+    # Verify all and only matching trades are returned
+    _assert_matches(results, matching_mask)
 
 
 # Feature: tcs-store, Property 9: Filter Correctness
 @given(
     num_trades=st.integers(min_value=3, max_value=15)
 )
-@settings(max_examples=100)
-def test_filter_correctness_nested_fields(num_trades):
+@settings(max_examples=25)
+def test_filter_correctness_nested_fields(store, service, num_trades):
     """
     Test filter correctness with nested field paths.
     
     For any filter on nested fields, only trades with matching
     nested values should be returned.
     """
-    store = InMemoryStore()
-    service = TradeService(store)
-    context = generate_context()
+    store.clear()
+    context = _CTX
     
     target_value = 1000000
     
     # Create trades with nested data
-    matching_trades = []
-    non_matching_trades = []
+    matching_mask = 0
     
+    batch = []
     for i in range(num_trades):
-        trade_id = str(uuid.uuid4())
+        trade_id = _ID_POOL[i]
         
         if i % 2 == 0:
             trade = {
@@ -120,7 +207,7 @@ def test_filter_correctness_nested_fields(num_trades):
                     }
                 }
             }
-            matching_trades.append(trade)
+            matching_mask |= 1 << i
         else:
             trade = {
                 "id": trade_id,
@@ -130,9 +217,10 @@ def test_filter_correctness_nested_fields(num_trades):
                     }
                 }
             }
-            non_matching_trades.append(trade)
         
-        service.save_new(trade, context)
+        batch.append(trade)
+    
+    service.save_new_batch(batch, context)
     
     # Filter by nested field
     filter_obj = TradeFilter(
@@ -142,37 +230,32 @@ def test_filter_correctness_nested_fields(num_trades):
     results = service.load_by_filter(filter_obj)
     
     # Verify correctness
-    result_ids = {t["id"] for t in results}
-    expected_ids = {t["id"] for t in matching_trades}
-    
-    assert result_ids == expected_ids
-    assert len(results) == len(matching_trades)
+    _assert_matches(results, matching_mask)
 
 
 # Feature: tcs-store, Property 9: Filter Correctness
-@given(
-    num_trades=st.integers(min_value=1, max_value=10)
-)
-@settings(max_examples=100)
-def test_empty_filter_returns_all(num_trades):
+@pytest.mark.parametrize("num_trades", [1, 3, 5, 7, 10])
+def test_empty_filter_returns_all(store, service, num_trades):
     """
     Test that empty filter returns all trades.
     
     For any set of trades, an empty filter should return all trades.
     """
-    store = InMemoryStore()
-    service = TradeService(store)
-    context = generate_context()
+    store.clear()
+    context = _CTX
     
     # Create trades
     trades = []
+    batch = []
     for i in range(num_trades):
         trade = {
-            "id": str(uuid.uuid4()),
+            "id": _ID_POOL[i],
             "data": {"index": i}
         }
-        service.save_new(trade, context)
+        batch.append(trade)
         trades.append(trade)
+
+    service.save_new_batch(batch, context)
     
     # Empty filter
     filter_obj = TradeFilter()
@@ -191,14 +274,14 @@ def test_empty_filter_returns_all(num_trades):
 @given(
     num_trades=st.integers(min_value=5, max_value=20),
     field_value=st.one_of(
-        st.text(min_size=1, max_size=20),
+        st.sampled_from(_FILTER_VALUES),
         st.integers(min_value=-1000000, max_value=1000000),
-        st.floats(min_value=-1000000.0, max_value=1000000.0, allow_nan=False, allow_infinity=False),
+        st.floats(min_value=-1000.0, max_value=1000.0, allow_nan=False, allow_infinity=False, width=32),
         st.booleans()
     )
 )
 @settings(max_examples=100)
-def test_equality_filter(num_trades, field_value):
+def test_equality_filter(store, service, num_trades, field_value):
     """
     Test equality filter property.
     
@@ -206,50 +289,46 @@ def test_equality_filter(num_trades, field_value):
     should return all trades where the field equals the value and no trades
     where it doesn't.
     """
-    store = InMemoryStore()
-    service = TradeService(store)
-    context = generate_context()
+    assume(not isinstance(field_value, float) or abs(field_value) > 1e-6)
+    
+    store.clear()
+    context = _CTX
+    
+    # Non-matching trades use one value that can never equal field_value
+    if isinstance(field_value, str):
+        different_value = f"{field_value}_different"
+    elif isinstance(field_value, bool):
+        # Checked before numbers, since bool is a subclass of int
+        different_value = not field_value
+    elif isinstance(field_value, (int, float)):
+        # For numeric values, move away from the value by a positive offset;
+        # using abs() keeps negative inputs from landing back on field_value
+        different_value = abs(field_value) * 2 + 100
+    else:
+        different_value = None
+    
+    # Trades only differ by ID, so they share these templates
+    match_template = {"data": {"test_field": field_value, "index": 0}}
+    nonmatch_template = {"data": {"test_field": different_value, "index": 0}}
     
     # Create trades with matching and non-matching values
-    matching_trades = []
-    non_matching_trades = []
+    matching_mask = 0
     
+    batch = []
     for i in range(num_trades):
-        trade_id = str(uuid.uuid4())
+        trade_id = _ID_POOL[i]
         
         if i % 2 == 0:
             # Matching trade
-            trade = {
-                "id": trade_id,
-                "data": {
-                    "test_field": field_value,
-                    "index": i
-                }
-            }
-            matching_trades.append(trade)
+            trade = {**match_template, "id": trade_id}
+            matching_mask |= 1 << i
         else:
-            # Non-matching trade - use a different value
-            if isinstance(field_value, str):
-                different_value = f"different_{i}"
-            elif isinstance(field_value, (int, float)):
-                # For numeric values, multiply by a factor to ensure difference
-                # This avoids floating point precision issues with large numbers
-                different_value = field_value * 2 + (i + 1) * 100
-            elif isinstance(field_value, bool):
-                different_value = not field_value
-            else:
-                different_value = None
-            
-            trade = {
-                "id": trade_id,
-                "data": {
-                    "test_field": different_value,
-                    "index": i
-                }
-            }
-            non_matching_trades.append(trade)
+            # Non-matching trade
+            trade = {**nonmatch_template, "id": trade_id}
         
-        service.save_new(trade, context)
+        batch.append(trade)
+    
+    service.save_new_batch(batch, context)
     
     # Apply equality filter
     filter_obj = TradeFilter(
@@ -259,43 +338,30 @@ def test_equality_filter(num_trades, field_value):
     results = service.load_by_filter(filter_obj)
     
     # Verify all and only matching trades are returned
-    result_ids = {t["id"] for t in results}
-    expected_ids = {t["id"] for t in matching_trades}
-    
-    assert result_ids == expected_ids
-    assert len(results) == len(matching_trades)
-    
-    # Verify all returned trades have the correct value
-    for trade in results:
-        assert trade["data"]["test_field"] == field_value
-    
-    # Verify no non-matching trades are returned
-    non_matching_ids = {t["id"] for t in non_matching_trades}
-    assert result_ids.isdisjoint(non_matching_ids)
+    _assert_matches(results, matching_mask)
 
 
 # Feature: tcs-store, Property 12: Equality Filter
 @given(
     num_trades=st.integers(min_value=3, max_value=15)
 )
-@settings(max_examples=100)
-def test_equality_filter_with_none(num_trades):
+@settings(max_examples=25)
+def test_equality_filter_with_none(store, service, num_trades):
     """
     Test equality filter with None values.
     
     Trades with None values should not match filters for other values,
     and vice versa.
     """
-    store = InMemoryStore()
-    service = TradeService(store)
-    context = generate_context()
+    store.clear()
+    context = _CTX
     
     # Create trades with None and non-None values
-    none_trades = []
-    value_trades = []
+    none_mask = 0
     
+    batch = []
     for i in range(num_trades):
-        trade_id = str(uuid.uuid4())
+        trade_id = _ID_POOL[i]
         
         if i % 2 == 0:
             trade = {
@@ -304,7 +370,7 @@ def test_equality_filter_with_none(num_trades):
                     "test_field": None
                 }
             }
-            none_trades.append(trade)
+            none_mask |= 1 << i
         else:
             trade = {
                 "id": trade_id,
@@ -312,9 +378,10 @@ def test_equality_filter_with_none(num_trades):
                     "test_field": "some_value"
                 }
             }
-            value_trades.append(trade)
         
-        service.save_new(trade, context)
+        batch.append(trade)
+    
+    service.save_new_batch(batch, context)
     
     # Filter for None
     filter_obj = TradeFilter(
@@ -322,10 +389,7 @@ def test_equality_filter_with_none(num_trades):
     )
     
     results = service.load_by_filter(filter_obj)
-    result_ids = {t["id"] for t in results}
-    expected_ids = {t["id"] for t in none_trades}
-    
-    assert result_ids == expected_ids
+    _assert_matches(results, none_mask)
     
     # Filter for non-None value
     filter_obj2 = TradeFilter(
@@ -333,10 +397,7 @@ def test_equality_filter_with_none(num_trades):
     )
     
     results2 = service.load_by_filter(filter_obj2)
-    result_ids2 = {t["id"] for t in results2}
-    expected_ids2 = {t["id"] for t in value_trades}
-    
-    assert result_ids2 == expected_ids2
+    _assert_matches(results2, ((1 << num_trades) - 1) & ~none_mask)
 
 
 
@@ -347,7 +408,7 @@ def test_equality_filter_with_none(num_trades):
     max_value=st.integers(min_value=101, max_value=200)
 )
 @settings(max_examples=100)
-def test_range_filter(num_trades, min_value, max_value):
+def test_range_filter(store, service, num_trades, min_value, max_value):
     """
     Test range filter property.
     
@@ -355,16 +416,15 @@ def test_range_filter(num_trades, min_value, max_value):
     {"field": {"gte": min, "lte": max}} should return all trades where
     the field value is within the range (inclusive) and no trades outside the range.
     """
-    store = InMemoryStore()
-    service = TradeService(store)
-    context = generate_context()
+    store.clear()
+    context = _CTX
     
     # Create trades with values inside and outside the range
-    in_range_trades = []
-    out_of_range_trades = []
+    matching_mask = 0
     
+    batch = []
     for i in range(num_trades):
-        trade_id = str(uuid.uuid4())
+        trade_id = _ID_POOL[i]
         
         if i % 2 == 0:
             # In range
@@ -375,7 +435,7 @@ def test_range_filter(num_trades, min_value, max_value):
                     "amount": value
                 }
             }
-            in_range_trades.append(trade)
+            matching_mask |= 1 << i
         else:
             # Out of range (either below min or above max)
             if i % 4 == 1:
@@ -389,9 +449,10 @@ def test_range_filter(num_trades, min_value, max_value):
                     "amount": value
                 }
             }
-            out_of_range_trades.append(trade)
         
-        service.save_new(trade, context)
+        batch.append(trade)
+    
+    service.save_new_batch(batch, context)
     
     # Apply range filter
     filter_obj = TradeFilter(
@@ -401,20 +462,7 @@ def test_range_filter(num_trades, min_value, max_value):
     results = service.load_by_filter(filter_obj)
     
     # Verify all and only in-range trades are returned
-    result_ids = {t["id"] for t in results}
-    expected_ids = {t["id"] for t in in_range_trades}
-    
-    assert result_ids == expected_ids
-    assert len(results) == len(in_range_trades)
-    
-    # Verify all returned trades have values in range
-    for trade in results:
-        value = trade["data"]["amount"]
-        assert min_value <= value <= max_value
-    
-    # Verify no out-of-range trades are returned
-    out_of_range_ids = {t["id"] for t in out_of_range_trades}
-    assert result_ids.isdisjoint(out_of_range_ids)
+    _assert_matches(results, matching_mask)
 
 
 # Feature: tcs-store, Property 13: Range Filter
@@ -423,24 +471,23 @@ def test_range_filter(num_trades, min_value, max_value):
     threshold=st.integers(min_value=50, max_value=150)
 )
 @settings(max_examples=100)
-def test_range_filter_gt_lt(num_trades, threshold):
+def test_range_filter_gt_lt(store, service, num_trades, threshold):
     """
     Test range filter with gt and lt operators (exclusive bounds).
     
     For any threshold, gt should return values strictly greater,
     and lt should return values strictly less.
     """
-    store = InMemoryStore()
-    service = TradeService(store)
-    context = generate_context()
+    store.clear()
+    context = _CTX
     
     # Create trades with values above, at, and below threshold
-    above_trades = []
-    at_threshold_trades = []
-    below_trades = []
+    above_mask = 0
+    below_mask = 0
     
+    batch = []
     for i in range(num_trades):
-        trade_id = str(uuid.uuid4())
+        trade_id = _ID_POOL[i]
         
         if i % 3 == 0:
             # Above threshold
@@ -448,60 +495,44 @@ def test_range_filter_gt_lt(num_trades, threshold):
                 "id": trade_id,
                 "data": {"value": threshold + i + 1}
             }
-            above_trades.append(trade)
+            above_mask |= 1 << i
         elif i % 3 == 1:
             # At threshold
             trade = {
                 "id": trade_id,
                 "data": {"value": threshold}
             }
-            at_threshold_trades.append(trade)
         else:
             # Below threshold
             trade = {
                 "id": trade_id,
                 "data": {"value": threshold - i - 1}
             }
-            below_trades.append(trade)
+            below_mask |= 1 << i
         
-        service.save_new(trade, context)
+        batch.append(trade)
+    
+    service.save_new_batch(batch, context)
     
     # Test gt (greater than, exclusive)
     filter_gt = TradeFilter(
         filter={"data.value": {"gt": threshold}}
     )
     results_gt = service.load_by_filter(filter_gt)
-    result_ids_gt = {t["id"] for t in results_gt}
-    expected_ids_gt = {t["id"] for t in above_trades}
-    
-    assert result_ids_gt == expected_ids_gt
-    
-    # Verify no trades at or below threshold
-    at_or_below_ids = {t["id"] for t in at_threshold_trades + below_trades}
-    assert result_ids_gt.isdisjoint(at_or_below_ids)
+    _assert_matches(results_gt, above_mask)
     
     # Test lt (less than, exclusive)
     filter_lt = TradeFilter(
         filter={"data.value": {"lt": threshold}}
     )
     results_lt = service.load_by_filter(filter_lt)
-    result_ids_lt = {t["id"] for t in results_lt}
-    expected_ids_lt = {t["id"] for t in below_trades}
-    
-    assert result_ids_lt == expected_ids_lt
-    
-    # Verify no trades at or above threshold
-    at_or_above_ids = {t["id"] for t in at_threshold_trades + above_trades}
-    assert result_ids_lt.isdisjoint(at_or_above_ids)
+    _assert_matches(results_lt, below_mask)
 
 
 
 # Feature: tcs-store, Property 14: Regex Filter
-@given(
-    num_trades=st.integers(min_value=5, max_value=20)
-)
-@settings(max_examples=100)
-def test_regex_filter(num_trades):
+@pytest.mark.parametrize("num_trades", [5, 7, 10, 15, 20])
+def test_regex_filter(store, service, num_trades):
     """
     Test regex filter property.
     
@@ -509,18 +540,17 @@ def test_regex_filter(num_trades):
     should return all trades where the field value matches the regex pattern
     and no trades that don't match.
     """
-    store = InMemoryStore()
-    service = TradeService(store)
-    context = generate_context()
+    store.clear()
+    context = _CTX
     
     # Create trades with matching and non-matching patterns
-    matching_trades = []
-    non_matching_trades = []
+    matching_mask = 0
     
-    pattern = "^BANK.*"
+    pattern = _BANK_RE
     
+    batch = []
     for i in range(num_trades):
-        trade_id = str(uuid.uuid4())
+        trade_id = _ID_POOL[i]
         
         if i % 2 == 0:
             # Matching pattern
@@ -530,7 +560,7 @@ def test_regex_filter(num_trades):
                     "counterparty": f"BANK_{i}"
                 }
             }
-            matching_trades.append(trade)
+            matching_mask |= 1 << i
         else:
             # Non-matching pattern
             trade = {
@@ -539,9 +569,10 @@ def test_regex_filter(num_trades):
                     "counterparty": f"CORP_{i}"
                 }
             }
-            non_matching_trades.append(trade)
         
-        service.save_new(trade, context)
+        batch.append(trade)
+    
+    service.save_new_batch(batch, context)
     
     # Apply regex filter
     filter_obj = TradeFilter(
@@ -551,112 +582,87 @@ def test_regex_filter(num_trades):
     results = service.load_by_filter(filter_obj)
     
     # Verify all and only matching trades are returned
-    result_ids = {t["id"] for t in results}
-    expected_ids = {t["id"] for t in matching_trades}
-    
-    assert result_ids == expected_ids
-    assert len(results) == len(matching_trades)
-    
-    # Verify all returned trades match the pattern
-    import re
-    for trade in results:
-        value = trade["data"]["counterparty"]
-        assert re.search(pattern, value) is not None
-    
-    # Verify no non-matching trades are returned
-    non_matching_ids = {t["id"] for t in non_matching_trades}
-    assert result_ids.isdisjoint(non_matching_ids)
+    _assert_matches(results, matching_mask)
 
 
 # Feature: tcs-store, Property 14: Regex Filter
-@given(
-    num_trades=st.integers(min_value=5, max_value=15)
-)
-@settings(max_examples=100)
-def test_regex_filter_case_sensitive(num_trades):
+@pytest.mark.parametrize("num_trades", [5, 7, 10, 12, 15])
+def test_regex_filter_case_sensitive(store, service, num_trades):
     """
     Test that regex filter is case-sensitive.
     
     Regex patterns should be case-sensitive by default.
     """
-    store = InMemoryStore()
-    service = TradeService(store)
-    context = generate_context()
+    store.clear()
+    context = _CTX
     
     # Create trades with different cases
-    uppercase_trades = []
-    lowercase_trades = []
+    matching_mask = 0
     
+    batch = []
     for i in range(num_trades):
-        trade_id = str(uuid.uuid4())
+        trade_id = _ID_POOL[i]
         
         if i % 2 == 0:
             trade = {
                 "id": trade_id,
                 "data": {"name": f"UPPER_{i}"}
             }
-            uppercase_trades.append(trade)
+            matching_mask |= 1 << i
         else:
             trade = {
                 "id": trade_id,
                 "data": {"name": f"upper_{i}"}
             }
-            lowercase_trades.append(trade)
         
-        service.save_new(trade, context)
+        batch.append(trade)
+    
+    service.save_new_batch(batch, context)
     
     # Filter for uppercase only
     filter_obj = TradeFilter(
-        filter={"data.name": {"regex": "^UPPER.*"}}
+        filter={"data.name": {"regex": _UPPER_RE}}
     )
     
     results = service.load_by_filter(filter_obj)
-    result_ids = {t["id"] for t in results}
-    expected_ids = {t["id"] for t in uppercase_trades}
-    
-    assert result_ids == expected_ids
     
-    # Verify lowercase trades are not returned
-    lowercase_ids = {t["id"] for t in lowercase_trades}
-    assert result_ids.isdisjoint(lowercase_ids)
+    # Only uppercase trades are returned
+    _assert_matches(results, matching_mask)
 
 
 # Feature: tcs-store, Property 14: Regex Filter
-@given(
-    num_trades=st.integers(min_value=3, max_value=10)
-)
-@settings(max_examples=100)
-def test_regex_filter_non_string_values(num_trades):
+@pytest.mark.parametrize("num_trades", [3, 5, 7, 10])
+def test_regex_filter_non_string_values(store, service, num_trades):
     """
     Test that regex filter only matches string values.
     
     Non-string values should not match regex filters.
     """
-    store = InMemoryStore()
-    service = TradeService(store)
-    context = generate_context()
+    store.clear()
+    context = _CTX
     
     # Create trades with string and non-string values
-    string_trades = []
-    non_string_trades = []
+    matching_mask = 0
     
+    batch = []
     for i in range(num_trades):
-        trade_id = str(uuid.uuid4())
+        trade_id = _ID_POOL[i]
         
         if i % 2 == 0:
             trade = {
                 "id": trade_id,
                 "data": {"field": "123"}
             }
-            string_trades.append(trade)
+            matching_mask |= 1 << i
         else:
             trade = {
                 "id": trade_id,
                 "data": {"field": 123}  # Integer, not string
             }
-            non_string_trades.append(trade)
         
-        service.save_new(trade, context)
+        batch.append(trade)
+    
+    service.save_new_batch(batch, context)
     
     # Filter with regex
     filter_obj = TradeFilter(
@@ -664,15 +670,9 @@ def test_regex_filter_non_string_values(num_trades):
     )
     
     results = service.load_by_filter(filter_obj)
-    result_ids = {t["id"] for t in results}
-    expected_ids = {t["id"] for t in string_trades}
     
     # Only string values should match
-    assert result_ids == expected_ids
-    
-    # Non-string values should not match
-    non_string_ids = {t["id"] for t in non_string_trades}
-    assert result_ids.isdisjoint(non_string_ids)
+    _assert_matches(results, matching_mask)
 
 
 
@@ -683,25 +683,22 @@ def test_regex_filter_non_string_values(num_trades):
     min_amount=st.integers(min_value=100, max_value=500)
 )
 @settings(max_examples=100)
-def test_multiple_filter_conditions_and_logic(num_trades, type_value, min_amount):
+def test_multiple_filter_conditions_and_logic(store, service, num_trades, type_value, min_amount):
     """
     Test multiple filter conditions with AND logic.
     
     For any filter with multiple conditions, only trades that satisfy
     ALL conditions should be returned (AND logic).
     """
-    store = InMemoryStore()
-    service = TradeService(store)
-    context = generate_context()
+    store.clear()
+    context = _CTX
     
     # Create trades with different combinations
-    both_match = []
-    type_only = []
-    amount_only = []
-    neither_match = []
+    matching_mask = 0
     
+    batch = []
     for i in range(num_trades):
-        trade_id = str(uuid.uuid4())
+        trade_id = _ID_POOL[i]
         
         # Distribute trades across all combinations
         if i % 4 == 0:
@@ -713,7 +710,7 @@ def test_multiple_filter_conditions_and_logic(num_trades, type_value, min_amount
                     "amount": min_amount + i
                 }
             }
-            both_match.append(trade)
+            matching_mask |= 1 << i
         elif i % 4 == 1:
             # Only type matches
             trade = {
@@ -723,7 +720,6 @@ def test_multiple_filter_conditions_and_logic(num_trades, type_value, min_amount
                     "amount": min_amount - i - 1
                 }
             }
-            type_only.append(trade)
         elif i % 4 == 2:
             # Only amount matches
             trade = {
@@ -733,7 +729,6 @@ def test_multiple_filter_conditions_and_logic(num_trades, type_value, min_amount
                     "amount": min_amount + i
                 }
             }
-            amount_only.append(trade)
         else:
             # Neither matches
             trade = {
@@ -743,9 +738,10 @@ def test_multiple_filter_conditions_and_logic(num_trades, type_value, min_amount
                     "amount": min_amount - i - 1
                 }
             }
-            neither_match.append(trade)
         
-        service.save_new(trade, context)
+        batch.append(trade)
+    
+    service.save_new_batch(batch, context)
     
     # Apply filter with multiple conditions (AND logic)
     filter_obj = TradeFilter(
@@ -758,43 +754,29 @@ def test_multiple_filter_conditions_and_logic(num_trades, type_value, min_amount
     results = service.load_by_filter(filter_obj)
     
     # Only trades matching BOTH conditions should be returned
-    result_ids = {t["id"] for t in results}
-    expected_ids = {t["id"] for t in both_match}
-    
-    assert result_ids == expected_ids
-    assert len(results) == len(both_match)
-    
-    # Verify all returned trades satisfy both conditions
-    for trade in results:
-        assert trade["data"]["trade_type"] == type_value
-        assert trade["data"]["amount"] >= min_amount
-    
-    # Verify trades matching only one condition are not returned
-    partial_match_ids = {t["id"] for t in type_only + amount_only + neither_match}
-    assert result_ids.isdisjoint(partial_match_ids)
+    _assert_matches(results, matching_mask)
 
 
 # Feature: tcs-store, Property 15: Multiple Filter Conditions (AND Logic)
 @given(
     num_trades=st.integers(min_value=6, max_value=15)
 )
-@settings(max_examples=100)
-def test_multiple_filter_conditions_three_conditions(num_trades):
+@settings(max_examples=25)
+def test_multiple_filter_conditions_three_conditions(store, service, num_trades):
     """
     Test multiple filter conditions with three conditions.
     
     All three conditions must be satisfied for a trade to match.
     """
-    store = InMemoryStore()
-    service = TradeService(store)
-    context = generate_context()
+    store.clear()
+    context = _CTX
     
     # Create trades - only some match all three conditions
-    all_match = []
-    partial_match = []
+    matching_mask = 0
     
+    batch = []
     for i in range(num_trades):
-        trade_id = str(uuid.uuid4())
+        trade_id = _ID_POOL[i]
         
         if i % 3 == 0:
             # All three conditions match
@@ -806,7 +788,7 @@ def test_multiple_filter_conditions_three_conditions(num_trades):
                     "amount": 1000
                 }
             }
-            all_match.append(trade)
+            matching_mask |= 1 << i
         else:
             # At least one condition doesn't match
             trade = {
@@ -817,9 +799,10 @@ def test_multiple_filter_conditions_three_conditions(num_trades):
                     "amount": 1000 if i % 4 == 0 else 500
                 }
             }
-            partial_match.append(trade)
         
-        service.save_new(trade, context)
+        batch.append(trade)
+    
+    service.save_new_batch(batch, context)
     
     # Filter with three conditions
     filter_obj = TradeFilter(
@@ -831,11 +814,9 @@ def test_multiple_filter_conditions_three_conditions(num_trades):
     )
     
     results = service.load_by_filter(filter_obj)
-    result_ids = {t["id"] for t in results}
-    expected_ids = {t["id"] for t in all_match}
     
     # Only trades matching all three conditions
-    assert result_ids == expected_ids
+    _assert_matches(results, matching_mask)
     
     # Verify all returned trades satisfy all conditions
     for trade in results:
@@ -848,10 +829,10 @@ def test_multiple_filter_conditions_three_conditions(num_trades):
 # Feature: tcs-store, Property 10: Count Matches Filter
 @given(
     num_trades=st.integers(min_value=5, max_value=25),
-    filter_value=st.text(min_size=1, max_size=20)
+    filter_value=st.sampled_from(_FILTER_VALUES)
 )
 @settings(max_examples=100)
-def test_count_matches_filter(num_trades, filter_value):
+def test_count_matches_filter(store, service, num_trades, filter_value):
     """
     Test count matches filter property.
     
@@ -859,13 +840,13 @@ def test_count_matches_filter(num_trades, filter_value):
     equal the number of trades that would be returned by load_by_filter
     with the same criteria.
     """
-    store = InMemoryStore()
-    service = TradeService(store)
-    context = generate_context()
+    store.clear()
+    context = _CTX
     
     # Create trades with some matching the filter
+    batch = []
     for i in range(num_trades):
-        trade_id = str(uuid.uuid4())
+        trade_id = _ID_POOL[i]
         
         # Some trades match, some don't
         if i % 3 == 0:
@@ -879,21 +860,20 @@ def test_count_matches_filter(num_trades, filter_value):
                 "data": {"category": f"other_{i}"}
             }
         
-        service.save_new(trade, context)
+        batch.append(trade)
+    
+    service.save_new_batch(batch, context)
     
     # Create filter
     filter_obj = TradeFilter(
         filter={"data.category": {"eq": filter_value}}
     )
     
-    # Get count
-    count = service.count_by_filter(filter_obj)
-    
     # Get actual trades
     trades = service.load_by_filter(filter_obj)
     
     # Count should match the number of trades returned
-    assert count == len(trades)
+    assert service.count_by_filter(filter_obj) == len(trades)
 
 
 # Feature: tcs-store, Property 10: Count Matches Filter
@@ -903,19 +883,19 @@ def test_count_matches_filter(num_trades, filter_value):
     max_value=st.integers(min_value=101, max_value=200)
 )
 @settings(max_examples=100)
-def test_count_matches_filter_range(num_trades, min_value, max_value):
+def test_count_matches_filter_range(store, service, num_trades, min_value, max_value):
     """
     Test count matches filter with range conditions.
     
     Count should match the number of trades in the range.
     """
-    store = InMemoryStore()
-    service = TradeService(store)
-    context = generate_context()
+    store.clear()
+    context = _CTX
     
     # Create trades with various amounts
+    batch = []
     for i in range(num_trades):
-        trade_id = str(uuid.uuid4())
+        trade_id = _ID_POOL[i]
         
         # Distribute values across the range
         if i % 3 == 0:
@@ -929,91 +909,88 @@ def test_count_matches_filter_range(num_trades, min_value, max_value):
             "id": trade_id,
             "data": {"amount": amount}
         }
-        service.save_new(trade, context)
+        batch.append(trade)
+    
+    service.save_new_batch(batch, context)
     
     # Filter with range
     filter_obj = TradeFilter(
         filter={"data.amount": {"gte": min_value, "lte": max_value}}
     )
     
-    # Get count and trades
-    count = service.count_by_filter(filter_obj)
+    # Get trades, then count against them
     trades = service.load_by_filter(filter_obj)
     
     # Count should match
-    assert count == len(trades)
+    assert service.count_by_filter(filter_obj) == len(trades)
 
 
 # Feature: tcs-store, Property 10: Count Matches Filter
-@given(
-    num_trades=st.integers(min_value=1, max_value=15)
-)
-@settings(max_examples=100)
-def test_count_matches_filter_empty_filter(num_trades):
+@pytest.mark.parametrize("num_trades", [1, 3, 5, 7, 10])
+def test_count_matches_filter_empty_filter(store, service, num_trades):
     """
     Test count with empty filter returns total count.
     
     Empty filter should count all trades.
     """
-    store = InMemoryStore()
-    service = TradeService(store)
-    context = generate_context()
+    store.clear()
+    context = _CTX
     
     # Create trades
+    batch = []
     for i in range(num_trades):
         trade = {
-            "id": str(uuid.uuid4()),
+            "id": _ID_POOL[i],
             "data": {"index": i}
         }
-        service.save_new(trade, context)
+        batch.append(trade)
+    
+    service.save_new_batch(batch, context)
     
     # Empty filter
     filter_obj = TradeFilter()
     
-    # Get count and trades
-    count = service.count_by_filter(filter_obj)
+    # Get trades, then count against them
     trades = service.load_by_filter(filter_obj)
     
     # Should count all trades
-    assert count == num_trades
-    assert count == len(trades)
+    assert len(trades) == num_trades
+    assert service.count_by_filter(filter_obj) == len(trades)
 
 
 # Feature: tcs-store, Property 10: Count Matches Filter
-@given(
-    num_trades=st.integers(min_value=5, max_value=20)
-)
-@settings(max_examples=100)
-def test_count_matches_filter_no_matches(num_trades):
+@pytest.mark.parametrize("num_trades", [5, 7, 10, 15, 20])
+def test_count_matches_filter_no_matches(store, service, num_trades):
     """
     Test count returns zero when no trades match.
     
     Filter with no matches should return count of 0.
     """
-    store = InMemoryStore()
-    service = TradeService(store)
-    context = generate_context()
+    store.clear()
+    context = _CTX
     
     # Create trades that won't match the filter
+    batch = []
     for i in range(num_trades):
         trade = {
-            "id": str(uuid.uuid4()),
+            "id": _ID_POOL[i],
             "data": {"type": f"TYPE_{i}"}
         }
-        service.save_new(trade, context)
+        batch.append(trade)
+    
+    service.save_new_batch(batch, context)
     
     # Filter that won't match any trade
     filter_obj = TradeFilter(
         filter={"data.type": {"eq": "NONEXISTENT_TYPE"}}
     )
     
-    # Get count and trades
-    count = service.count_by_filter(filter_obj)
+    # Get trades, then count against them
     trades = service.load_by_filter(filter_obj)
     
     # Should be zero
-    assert count == 0
     assert len(trades) == 0
+    assert service.count_by_filter(filter_obj) == 0
 
 
 
@@ -1022,8 +999,8 @@ def test_count_matches_filter_no_matches(num_trades):
     num_trades=st.integers(min_value=5, max_value=25),
     filter_value=st.text(min_size=1, max_size=20)
 )
-@settings(max_examples=100)
-def test_list_matches_filter(num_trades, filter_value):
+@settings(max_examples=25, derandomize=True)
+def test_list_matches_filter(store, service, num_trades, filter_value):
     """
     Test list matches filter property.
     
@@ -1031,13 +1008,13 @@ def test_list_matches_filter(num_trades, filter_value):
     correspond exactly to the trades returned by load_by_filter with the same
     criteria (same IDs, same count).
     """
-    store = InMemoryStore()
-    service = TradeService(store)
-    context = generate_context()
+    store.clear()
+    context = _CTX
     
     # Create trades
+    batch = []
     for i in range(num_trades):
-        trade_id = str(uuid.uuid4())
+        trade_id = _ID_POOL[i]
         
         # Some trades match, some don't
         if i % 3 == 0:
@@ -1051,12 +1028,13 @@ def test_list_matches_filter(num_trades, filter_value):
                 "data": {"status": f"other_{i}"}
             }
         
-        service.save_new(trade, context)
+        batch.append(trade)
     
-    # Create filter
-    filter_obj = TradeFilter(
-        filter={"data.status": {"eq": filter_value}}
-    )
+    service.save_new_batch(batch, context)
+    
+    # Create filter from the validated template, filling in this example's value
+    filter_obj = _STATUS_FILTER_TEMPLATE.model_copy(deep=True)
+    filter_obj.filter["data.status"]["eq"] = filter_value
     
     # Get list items and full trades
     list_items = service.list_by_filter(filter_obj)
@@ -1066,9 +1044,7 @@ def test_list_matches_filter(num_trades, filter_value):
     assert len(list_items) == len(full_trades)
     
     # Should have same IDs
-    list_ids = {item["id"] for item in list_items}
-    trade_ids = {trade["id"] for trade in full_trades}
-    assert list_ids == trade_ids
+    assert set(map(_get_id, list_items)) == set(map(_get_id, full_trades))
 
 
 # Feature: tcs-store, Property 11: List Matches Filter
@@ -1077,20 +1053,20 @@ def test_list_matches_filter(num_trades, filter_value):
     min_value=st.integers(min_value=0, max_value=100),
     max_value=st.integers(min_value=101, max_value=200)
 )
-@settings(max_examples=100)
-def test_list_matches_filter_complex(num_trades, min_value, max_value):
+@settings(max_examples=25, derandomize=True)
+def test_list_matches_filter_complex(store, service, num_trades, min_value, max_value):
     """
     Test list matches filter with complex filter conditions.
     
     List and load should return the same trades for complex filters.
     """
-    store = InMemoryStore()
-    service = TradeService(store)
-    context = generate_context()
+    store.clear()
+    context = _CTX
     
     # Create trades with various values
+    batch = []
     for i in range(num_trades):
-        trade_id = str(uuid.uuid4())
+        trade_id = _ID_POOL[i]
         
         trade = {
             "id": trade_id,
@@ -1099,15 +1075,13 @@ def test_list_matches_filter_complex(num_trades, min_value, max_value):
                 "amount": min_value + (i * 10)
             }
         }
-        service.save_new(trade, context)
+        batch.append(trade)
     
-    # Complex filter
-    filter_obj = TradeFilter(
-        filter={
-            "data.type": {"eq": "SWAP"},
-            "data.amount": {"gte": min_value, "lte": max_value}
-        }
-    )
+    service.save_new_batch(batch, context)
+    
+    # Complex filter from the validated template with this example's bounds
+    filter_obj = _SWAP_AMOUNT_FILTER_TEMPLATE.model_copy(deep=True)
+    filter_obj.filter["data.amount"].update(gte=min_value, lte=max_value)
     
     # Get list and load results
     list_items = service.list_by_filter(filter_obj)
@@ -1116,33 +1090,33 @@ def test_list_matches_filter_complex(num_trades, min_value, max_value):
     # Should match
     assert len(list_items) == len(full_trades)
     
-    list_ids = {item["id"] for item in list_items}
-    trade_ids = {trade["id"] for trade in full_trades}
-    assert list_ids == trade_ids
+    assert set(map(_get_id, list_items)) == set(map(_get_id, full_trades))
 
 
 # Feature: tcs-store, Property 11: List Matches Filter
 @given(
     num_trades=st.integers(min_value=1, max_value=15)
 )
-@settings(max_examples=100)
-def test_list_matches_filter_empty_filter(num_trades):
+@settings(max_examples=25, derandomize=True)
+def test_list_matches_filter_empty_filter(store, service, num_trades):
     """
     Test list matches filter with empty filter.
     
     Empty filter should return all trades in both list and load.
     """
-    store = InMemoryStore()
-    service = TradeService(store)
-    context = generate_context()
+    store.clear()
+    context = _CTX
     
     # Create trades
+    batch = []
     for i in range(num_trades):
         trade = {
-            "id": str(uuid.uuid4()),
+            "id": _ID_POOL[i],
             "data": {"index": i}
         }
-        service.save_new(trade, context)
+        batch.append(trade)
+    
+    service.save_new_batch(batch, context)
     
     # Empty filter
     filter_obj = TradeFilter()
@@ -1156,33 +1130,22 @@ def test_list_matches_filter_empty_filter(num_trades):
     assert len(full_trades) == num_trades
     
     # Same IDs
-    list_ids = {item["id"] for item in list_items}
-    trade_ids = {trade["id"] for trade in full_trades}
-    assert list_ids == trade_ids
+    assert set(map(_get_id, list_items)) == set(map(_get_id, full_trades))
 
 
 # Feature: tcs-store, Property 11: List Matches Filter
 @given(
     num_trades=st.integers(min_value=5, max_value=20)
 )
-@settings(max_examples=100)
-def test_list_matches_filter_no_matches(num_trades):
+@settings(max_examples=25, derandomize=True)
+def test_list_matches_filter_no_matches(category_services, num_trades):
     """
     Test list matches filter when no trades match.
     
     Both list and load should return empty results.
     """
-    store = InMemoryStore()
-    service = TradeService(store)
-    context = generate_context()
-    
-    # Create trades
-    for i in range(num_trades):
-        trade = {
-            "id": str(uuid.uuid4()),
-            "data": {"category": f"CAT_{i}"}
-        }
-        service.save_new(trade, context)
+    # Read-only, so the prepopulated service for this size is reused as-is
+    service = category_services(num_trades)
     
     # Filter that won't match
     filter_obj = TradeFilter(
@@ -1196,3 +1159,52 @@ def test_list_matches_filter_no_matches(num_trades):
     # Both should be empty
     assert len(list_items) == 0
     assert len(full_trades) == 0
+
+
+# Feature: tcs-store, Property 9: Filter Correctness (result order)
+@given(
+    operations=st.lists(
+        st.tuples(
+            st.booleans(),
+            st.integers(min_value=0, max_value=7),
+            st.sampled_from(["SWAP", "OPTION", None]),
+            st.none() | st.integers(min_value=0, max_value=5)
+        ),
+        max_size=30
+    ),
+    conditions=st.fixed_dictionaries(
+        {},
+        optional={
+            "data.type": st.sampled_from(["SWAP", "OPTION"]).map(lambda v: {"eq": v}),
+            "data.amount": st.integers(min_value=0, max_value=5).map(lambda v: {"gte": v}),
+        }
+    )
+)
+def test_indexed_filter_keeps_store_order(operations, conditions):
+    """
+    Test that indexed lookups do not change load_by_filter result order.
+    
+    After any mix of saves, updates and deletes, a service over an indexed
+    store should return the same trades in the same order as one that
+    scans an unindexed store.
+    """
+    indexed_store = InMemoryStore(indexed_paths=("data.type", "data.amount"))
+    scan_store = InMemoryStore()
+    context = _CTX.model_dump()
+    
+    for is_delete, index, trade_type, amount in operations:
+        trade_id = _ID_POOL[index]
+        for target in (indexed_store, scan_store):
+            if is_delete:
+                target.delete(trade_id, context)
+            else:
+                target.save(
+                    trade_id,
+                    {"id": trade_id, "data": {"type": trade_type, "amount": amount}},
+                    context
+                )
+    
+    filter_obj = TradeFilter(filter=conditions)
+    indexed_ids = list(map(_get_id, TradeService(indexed_store).load_by_filter(filter_obj)))
+    scan_ids = list(map(_get_id, TradeService(scan_store).load_by_filter(filter_obj)))
+    assert indexed_ids == scan_ids
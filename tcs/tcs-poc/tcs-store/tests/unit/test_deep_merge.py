@@ -17,185 +17,154 @@ def create_context():
     )
 
 
-class TestDeepMergeScenarios:
-    """Tests for specific deep merge edge cases."""
+@pytest.fixture
+def merge_fixture():
+    """
+    Provide a service, a context and a factory that saves the base trade.
     
-    def test_nested_object_removal_with_null(self):
-        """Test that nested objects are removed when set to null."""
-        store = InMemoryStore()
-        service = TradeService(store)
-        context = create_context()
-        
-        # Create trade with nested object
-        trade = {
-            "id": "trade-123",
-            "data": {
-                "leg1": {"notional": 1000000, "currency": "USD"},
-                "leg2": {"notional": 2000000, "currency": "EUR"},
-                "broker": "BROKER_A"
-            }
-        }
-        service.save_new(trade, context)
-        
-        # Set leg2 (object) to null - should remove it
-        updates = {"data": {"leg2": None}}
-        updated = service.save_partial("trade-123", updates, context)
-        
-        # Verify leg2 removed
-        assert "leg2" not in updated["data"]
-        
-        # Verify leg1 and broker preserved
-        assert updated["data"]["leg1"] == {"notional": 1000000, "currency": "USD"}
-        assert updated["data"]["broker"] == "BROKER_A"
+    The factory stores its argument as the data of trade "trade-123" and
+    returns that ID, so each test only spells out its own starting state.
+    """
+    service = TradeService(InMemoryStore())
+    context = create_context()
     
-    def test_primitive_field_set_to_null(self):
-        """Test that primitive fields are set to null, not removed."""
-        store = InMemoryStore()
-        service = TradeService(store)
-        context = create_context()
-        
-        # Create trade with primitive fields
-        trade = {
-            "id": "trade-123",
-            "data": {
-                "broker": "BROKER_A",
-                "trader": "TRADER_1",
-                "notional": 1000000
-            }
-        }
-        service.save_new(trade, context)
-        
-        # Set broker (string) to null - should set to null, not remove
-        updates = {"data": {"broker": None}}
-        updated = service.save_partial("trade-123", updates, context)
-        
-        # Verify broker is null (not removed)
-        assert "broker" in updated["data"]
-        assert updated["data"]["broker"] is None
-        
-        # Verify other fields preserved
-        assert updated["data"]["trader"] == "TRADER_1"
-        assert updated["data"]["notional"] == 1000000
+    def save_base(data):
+        service.save_new({"id": "trade-123", "data": data}, context)
+        return "trade-123"
     
-    def test_deeply_nested_merge_5_levels(self):
-        """Test deep merge with 5+ levels of nesting."""
-        store = InMemoryStore()
-        service = TradeService(store)
-        context = create_context()
-        
-        # Create trade with deeply nested structure
-        trade = {
-            "id": "trade-123",
-            "data": {
-                "level1": {
-                    "level2": {
-                        "level3": {
-                            "level4": {
-                                "level5": {
-                                    "value": "original",
-                                    "other": "preserved"
-                                }
-                            }
-                        }
-                    }
-                }
-            }
-        }
-        service.save_new(trade, context)
-        
-        # Update deeply nested value
-        updates = {
-            "data": {
-                "level1": {
-                    "level2": {
-                        "level3": {
-                            "level4": {
-                                "level5": {
-                                    "value": "updated"
-                                }
-                            }
-                        }
-                    }
-                }
-            }
-        }
-        updated = service.save_partial("trade-123", updates, context)
-        
-        # Verify deep value updated
-        assert updated["data"]["level1"]["level2"]["level3"]["level4"]["level5"]["value"] == "updated"
-        
-        # Verify other deep value preserved
-        assert updated["data"]["level1"]["level2"]["level3"]["level4"]["level5"]["other"] == "preserved"
+    return service, context, save_base
+
+
+def _check_nested_object_removed(updated):
+    """Check that leg2 was removed and its siblings kept."""
+    # Verify leg2 removed
+    assert "leg2" not in updated["data"]
     
-    def test_list_replacement(self):
-        """Test that lists are replaced entirely, not merged."""
-        store = InMemoryStore()
-        service = TradeService(store)
-        context = create_context()
-        
-        # Create trade with list
-        trade = {
-            "id": "trade-123",
-            "data": {
-                "schedule": [
-                    {"date": "2024-01-01", "amount": 1000},
-                    {"date": "2024-02-01", "amount": 2000}
-                ]
-            }
-        }
-        service.save_new(trade, context)
-        
-        # Update schedule with new list
-        updates = {
-            "data": {
-                "schedule": [
-                    {"date": "2024-04-01", "amount": 4000}
-                ]
-            }
-        }
-        updated = service.save_partial("trade-123", updates, context)
-        
-        # Verify list was replaced, not merged
-        assert len(updated["data"]["schedule"]) == 1
-        assert updated["data"]["schedule"][0] == {"date": "2024-04-01", "amount": 4000}
+    # Verify leg1 and broker preserved
+    assert updated["data"]["leg1"] == {"notional": 1000000, "currency": "USD"}
+    assert updated["data"]["broker"] == "BROKER_A"
+
 
+def _check_primitive_set_to_null(updated):
+    """Check that broker is null and the other fields kept."""
+    # Verify broker is null (not removed)
+    assert "broker" in updated["data"]
+    assert updated["data"]["broker"] is None
     
-    def test_mixed_null_handling(self):
-        """Test mixed null handling for objects and primitives."""
-        store = InMemoryStore()
-        service = TradeService(store)
-        context = create_context()
-        
-        # Create trade with mixed types
-        trade = {
-            "id": "trade-123",
-            "data": {
-                "leg1": {"notional": 1000000},
-                "broker": "BROKER_A",
-                "notional": 5000000,
-                "active": True
-            }
-        }
-        service.save_new(trade, context)
-        
-        # Set various fields to null
-        updates = {
-            "data": {
-                "leg1": None,
-                "broker": None,
-                "notional": None,
-                "active": None
-            }
-        }
-        updated = service.save_partial("trade-123", updates, context)
+    # Verify other fields preserved
+    assert updated["data"]["trader"] == "TRADER_1"
+    assert updated["data"]["notional"] == 1000000
+
+
+def _check_deep_value_updated(updated):
+    """Check the 5-level-deep leaf was merged, not replaced."""
+    leaf = updated["data"]["level1"]["level2"]["level3"]["level4"]["level5"]
+    
+    # Verify deep value updated and other deep value preserved
+    assert leaf["value"] == "updated"
+    assert leaf["other"] == "preserved"
+
+
+def _check_list_replaced(updated):
+    """Check that the schedule list was replaced, not merged."""
+    # Verify list was replaced, not merged
+    assert len(updated["data"]["schedule"]) == 1
+    assert updated["data"]["schedule"][0] == {"date": "2024-04-01", "amount": 4000}
+
+
+def _check_mixed_nulls(updated):
+    """Check that leg1 was removed and the primitives set to null."""
+    # Verify object removed
+    assert "leg1" not in updated["data"]
+    
+    # Verify primitives set to null
+    for key in ("broker", "notional", "active"):
+        assert key in updated["data"]
+        assert updated["data"][key] is None
+
+
+class TestDeepMergeScenarios:
+    """Tests for specific deep merge edge cases."""
+    
+    @pytest.mark.parametrize(
+        "initial_data,updates,check",
+        [
+            # Nested objects are removed when set to null
+            pytest.param(
+                {
+                    "leg1": {"notional": 1000000, "currency": "USD"},
+                    "leg2": {"notional": 2000000, "currency": "EUR"},
+                    "broker": "BROKER_A"
+                },
+                {"data": {"leg2": None}},
+                _check_nested_object_removed,
+                id="nested_object_removal_with_null",
+            ),
+            # Primitive fields are set to null, not removed
+            pytest.param(
+                {
+                    "broker": "BROKER_A",
+                    "trader": "TRADER_1",
+                    "notional": 1000000
+                },
+                {"data": {"broker": None}},
+                _check_primitive_set_to_null,
+                id="primitive_field_set_to_null",
+            ),
+            # Merges reach values nested 5+ levels deep
+            pytest.param(
+                {
+                    "level1": {"level2": {"level3": {"level4": {"level5": {
+                        "value": "original",
+                        "other": "preserved"
+                    }}}}}
+                },
+                {
+                    "data": {"level1": {"level2": {"level3": {"level4": {"level5": {
+                        "value": "updated"
+                    }}}}}}
+                },
+                _check_deep_value_updated,
+                id="deeply_nested_merge_5_levels",
+            ),
+            # Lists are replaced entirely, not merged
+            pytest.param(
+                {
+                    "schedule": [
+                        {"date": "2024-01-01", "amount": 1000},
+                        {"date": "2024-02-01", "amount": 2000}
+                    ]
+                },
+                {"data": {"schedule": [{"date": "2024-04-01", "amount": 4000}]}},
+                _check_list_replaced,
+                id="list_replacement",
+            ),
+            # Objects and primitives set to null in one update
+            pytest.param(
+                {
+                    "leg1": {"notional": 1000000},
+                    "broker": "BROKER_A",
+                    "notional": 5000000,
+                    "active": True
+                },
+                {
+                    "data": {
+                        "leg1": None,
+                        "broker": None,
+                        "notional": None,
+                        "active": None
+                    }
+                },
+                _check_mixed_nulls,
+                id="mixed_null_handling",
+            ),
+        ],
+    )
+    def test_deep_merge_scenario(self, merge_fixture, initial_data, updates, check):
+        """Test that a partial update merges into the base trade as expected."""
+        service, context, save_base = merge_fixture
         
-        # Verify object removed
-        assert "leg1" not in updated["data"]
+        trade_id = save_base(initial_data)
+        updated = service.save_partial(trade_id, updates, context)
         
-        # Verify primitives set to null
-        assert "broker" in updated["data"]
-        assert updated["data"]["broker"] is None
-        assert "notional" in updated["data"]
-        assert updated["data"]["notional"] is None
-        assert "active" in updated["data"]
-        assert updated["data"]["active"] is None
+        check(updated)
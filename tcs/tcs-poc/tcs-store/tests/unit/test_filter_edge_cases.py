@@ -1,295 +1,292 @@
 """Unit tests for filter edge cases."""
 
-import uuid
+import functools
+import itertools
+import re
+from operator import itemgetter
 import pytest
 
 from tcs_store.storage.in_memory_store import InMemoryStore
-from tcs_store.services.trade_service import TradeService
+from tcs_store.services.trade_service import TradeService, compile_filter
 from tcs_store.models import Context
 from tcs_store.models.filter import TradeFilter
 from tcs_store.exceptions import InvalidFilterError
+from tests._filters import eq, ne, in_, nin
 
 
+_ids = itertools.count()
+
+
+def next_id():
+    """Return a trade ID unique within this test session."""
+    return f"t-{next(_ids)}"
+
+
+# Read-only filters shared by the empty- and no-match tests, validated once
+EMPTY_FILTER = TradeFilter()
+NO_MATCH_FILTER = eq("data.type", "NONEXISTENT")
+
+
+@functools.lru_cache(maxsize=1)
 def generate_context():
-    """Generate a valid context."""
-    return Context(
-        user=f"user_{uuid.uuid4().hex[:8]}",
+    """
+    Return a valid context, built once and shared; no test checks the user.
+    
+    Model validation is skipped because context validation is not under test
+    here; the service still checks that each field is non-empty.
+    """
+    return Context.model_construct(
+        user="test_user",
         agent="test_agent",
         action="test_action",
         intent="test_intent"
     )
 
 
-def test_empty_filter_returns_all_trades():
+@pytest.fixture
+def service():
+    """Provide a trade service over a fresh, unindexed in-memory store."""
+    return TradeService(InMemoryStore())
+
+
+@pytest.fixture
+def context():
+    """Provide a valid context."""
+    return generate_context()
+
+
+def test_empty_filter_returns_all_trades(service, context):
     """
     Test that empty filter returns all trades.
     
     Requirements: 6.2
     """
-    store = InMemoryStore()
-    service = TradeService(store)
-    context = generate_context()
-    
     # Create multiple trades
-    trades = []
-    for i in range(5):
-        trade = {
-            "id": str(uuid.uuid4()),
-            "data": {"index": i}
-        }
-        service.save_new(trade, context)
-        trades.append(trade)
+    trades = [
+        {"id": next_id(), "data": {"index": i}}
+        for i in range(5)
+    ]
+    service.save_new_batch(trades, context)
     
     # Empty filter
-    filter_obj = TradeFilter()
+    filter_obj = EMPTY_FILTER
     
     # Should return all trades
     results = service.load_by_filter(filter_obj)
-    assert len(results) == 5
-    
-    result_ids = {t["id"] for t in results}
-    expected_ids = {t["id"] for t in trades}
-    assert result_ids == expected_ids
+    assert sorted(results, key=itemgetter("id")) == sorted(trades, key=itemgetter("id"))
 
 
-def test_filter_with_no_matches():
+def test_filter_with_no_matches(service, context):
     """
     Test filter that matches no trades.
     
     Requirements: 6.2
     """
-    store = InMemoryStore()
-    service = TradeService(store)
-    context = generate_context()
-    
     # Create trades
-    for i in range(5):
-        trade = {
-            "id": str(uuid.uuid4()),
-            "data": {"type": f"TYPE_{i}"}
-        }
-        service.save_new(trade, context)
+    service.save_new_batch(
+        [
+            {"id": next_id(), "data": {"type": f"TYPE_{i}"}}
+            for i in range(5)
+        ],
+        context
+    )
     
     # Filter that won't match any trade
-    filter_obj = TradeFilter(
-        filter={"data.type": {"eq": "NONEXISTENT_TYPE"}}
-    )
+    filter_obj = NO_MATCH_FILTER
     
     # Should return empty list
     results = service.load_by_filter(filter_obj)
-    assert len(results) == 0
     assert results == []
 
 
-def test_filter_with_nonexistent_field():
+def test_filter_with_nonexistent_field(service, context):
     """
     Test filter on a field that doesn't exist in any trade.
     
     Requirements: 6.2
     """
-    store = InMemoryStore()
-    service = TradeService(store)
-    context = generate_context()
-    
     # Create trades without the filtered field
-    for i in range(3):
-        trade = {
-            "id": str(uuid.uuid4()),
-            "data": {"existing_field": i}
-        }
-        service.save_new(trade, context)
+    service.save_new_batch(
+        [
+            {"id": next_id(), "data": {"existing_field": i}}
+            for i in range(3)
+        ],
+        context
+    )
     
     # Filter on non-existent field
-    filter_obj = TradeFilter(
-        filter={"data.nonexistent_field": {"eq": "value"}}
-    )
+    filter_obj = eq("data.nonexistent_field", "value")
     
     # Should return empty list (no trades have this field)
     results = service.load_by_filter(filter_obj)
-    assert len(results) == 0
+    assert results == []
 
 
-def test_invalid_filter_structure_non_dict_conditions():
+@pytest.mark.parametrize(
+    "bad_filter,message",
+    [
+        # Conditions should be a dict, not a string
+        ({"data.field": "value"}, "must be a dictionary"),
+        ({"data.field": {"unknown_op": "value"}}, "Unknown filter operator"),
+        ({"data.field": {"regex": "[invalid(regex"}}, "Invalid regex pattern"),
+        ({"data.field": {"in": "not_a_list"}}, "'in' operator requires a list"),
+        ({"data.field": {"nin": "not_a_list"}}, "'nin' operator requires a list"),
+    ],
+    ids=["non_dict_conditions", "unknown_operator", "regex_pattern", "in_non_list", "nin_non_list"],
+)
+def test_invalid_filter(service, context, bad_filter, message):
     """
-    Test that filter with non-dict conditions raises error.
+    Test that a malformed filter raises InvalidFilterError with a clear message.
     
     Requirements: 6.3
     """
-    store = InMemoryStore()
-    service = TradeService(store)
-    context = generate_context()
-    
     # Create a trade
     trade = {
-        "id": str(uuid.uuid4()),
+        "id": next_id(),
         "data": {"field": "value"}
     }
     service.save_new(trade, context)
     
-    # Invalid filter - conditions should be a dict, not a string
-    filter_obj = TradeFilter(
-        filter={"data.field": "value"}  # Should be {"eq": "value"}
-    )
+    filter_obj = TradeFilter(filter=bad_filter)
     
-    # Should raise InvalidFilterError
-    with pytest.raises(InvalidFilterError, match="must be a dictionary"):
+    with pytest.raises(InvalidFilterError, match=message):
         service.load_by_filter(filter_obj)
 
 
-def test_invalid_filter_unknown_operator():
+def test_filter_regex_compiled_pattern(service, context):
     """
-    Test that filter with unknown operator raises error.
+    Test that a precompiled regex pattern is accepted by the regex operator.
     
-    Requirements: 6.3
+    Requirements: 6.1
     """
-    store = InMemoryStore()
-    service = TradeService(store)
-    context = generate_context()
-    
-    # Create a trade
-    trade = {
-        "id": str(uuid.uuid4()),
-        "data": {"field": "value"}
+    trade1 = {
+        "id": next_id(),
+        "data": {"counterparty": "BANK_A"}
+    }
+    trade2 = {
+        "id": next_id(),
+        "data": {"counterparty": "CORP_B"}
     }
-    service.save_new(trade, context)
     
-    # Invalid filter - unknown operator
+    service.save_new_batch([trade1, trade2], context)
+    
     filter_obj = TradeFilter(
-        filter={"data.field": {"unknown_op": "value"}}
+        filter={"data.counterparty": {"regex": re.compile("^BANK")}}
     )
     
-    # Should raise InvalidFilterError
-    with pytest.raises(InvalidFilterError, match="Unknown filter operator"):
-        service.load_by_filter(filter_obj)
+    results = service.load_by_filter(filter_obj)
+    assert len(results) == 1
+    assert results[0]["id"] == trade1["id"]
 
 
-def test_invalid_filter_regex_pattern():
+def test_invalid_filter_rejected_on_empty_store(service):
     """
-    Test that filter with invalid regex pattern raises error.
+    Test that a malformed filter is rejected even when no trades are stored.
     
     Requirements: 6.3
     """
-    store = InMemoryStore()
-    service = TradeService(store)
-    context = generate_context()
-    
-    # Create a trade
-    trade = {
-        "id": str(uuid.uuid4()),
-        "data": {"field": "value"}
-    }
-    service.save_new(trade, context)
-    
-    # Invalid regex pattern
     filter_obj = TradeFilter(
-        filter={"data.field": {"regex": "[invalid(regex"}}
+        filter={"data.field": {"unknown_op": "value"}}
     )
     
-    # Should raise InvalidFilterError
-    with pytest.raises(InvalidFilterError, match="Invalid regex pattern"):
+    with pytest.raises(InvalidFilterError, match="Unknown filter operator"):
         service.load_by_filter(filter_obj)
+    with pytest.raises(InvalidFilterError, match="Unknown filter operator"):
+        service.count_by_filter(filter_obj)
 
 
-def test_invalid_filter_in_operator_non_list():
+def test_compiled_filter_is_reused():
     """
-    Test that 'in' operator with non-list value raises error.
+    Test that equal filter criteria share one compiled filter, keyed by type.
     
-    Requirements: 6.3
+    Requirements: 6.1
     """
-    store = InMemoryStore()
-    service = TradeService(store)
-    context = generate_context()
+    first = compile_filter({"data.type": {"in": ["SWAP", "OPTION"]}})
+    second = compile_filter({"data.type": {"in": ["SWAP", "OPTION"]}})
+    assert first is second
     
-    # Create a trade
-    trade = {
-        "id": str(uuid.uuid4()),
-        "data": {"field": "value"}
-    }
-    service.save_new(trade, context)
+    # 1 == True, but they are different filters
+    assert compile_filter({"data.flag": {"eq": 1}}) is not compile_filter({"data.flag": {"eq": True}})
+
+
+def test_contradictory_filter_matches_nothing(service, context):
+    """
+    Test that an eq condition contradicted by another operator matches nothing.
+    
+    Requirements: 6.2
+    """
+    service.save_new({"id": next_id(), "data": {"amount": 5}}, context)
     
-    # Invalid 'in' operator - should be a list
     filter_obj = TradeFilter(
-        filter={"data.field": {"in": "not_a_list"}}
+        filter={"data.amount": {"eq": 5, "gt": 10}}
     )
     
-    # Should raise InvalidFilterError
-    with pytest.raises(InvalidFilterError, match="'in' operator requires a list"):
-        service.load_by_filter(filter_obj)
+    assert compile_filter(filter_obj.filter).never_matches
+    assert service.load_by_filter(filter_obj) == []
+    assert service.count_by_filter(filter_obj) == 0
+    
+    # Consistent conditions are still evaluated per trade
+    filter_obj = TradeFilter(
+        filter={"data.amount": {"eq": 5, "lt": 10}}
+    )
+    assert not compile_filter(filter_obj.filter).never_matches
+    assert len(service.load_by_filter(filter_obj)) == 1
 
 
-def test_invalid_filter_nin_operator_non_list():
+def test_range_filter_incomparable_value_does_not_match(service, context):
     """
-    Test that 'nin' operator with non-list value raises error.
-    
-    Requirements: 6.3
+    Test that a range check on an incomparable value is a non-match, not an error.
+
+    Range conditions run before regex conditions, so here the gt check sees
+    a bool against None even though the regex alone already rejects the trade.
+
+    Requirements: 6.2
     """
-    store = InMemoryStore()
-    service = TradeService(store)
-    context = generate_context()
-    
-    # Create a trade
-    trade = {
-        "id": str(uuid.uuid4()),
-        "data": {"field": "value"}
-    }
-    service.save_new(trade, context)
-    
-    # Invalid 'nin' operator - should be a list
+    service.save_new({"id": next_id(), "data": {"w": "zzz", "v": False}}, context)
+
     filter_obj = TradeFilter(
-        filter={"data.field": {"nin": "not_a_list"}}
+        filter={"data.w": {"regex": "^a"}, "data.v": {"gt": None}}
     )
-    
-    # Should raise InvalidFilterError
-    with pytest.raises(InvalidFilterError, match="'nin' operator requires a list"):
-        service.load_by_filter(filter_obj)
+
+    assert service.load_by_filter(filter_obj) == []
+    assert service.count_by_filter(filter_obj) == 0
 
 
-def test_filter_with_null_values():
+def test_filter_with_null_values(service, context):
     """
     Test filtering with null values.
     
     Requirements: 6.2
     """
-    store = InMemoryStore()
-    service = TradeService(store)
-    context = generate_context()
-    
     # Create trades with null and non-null values
     trade1 = {
-        "id": str(uuid.uuid4()),
+        "id": next_id(),
         "data": {"field": None}
     }
     trade2 = {
-        "id": str(uuid.uuid4()),
+        "id": next_id(),
         "data": {"field": "value"}
     }
     
-    service.save_new(trade1, context)
-    service.save_new(trade2, context)
+    service.save_new_batch([trade1, trade2], context)
     
     # Filter for null
-    filter_obj = TradeFilter(
-        filter={"data.field": {"eq": None}}
-    )
+    filter_obj = eq("data.field", None)
     
     results = service.load_by_filter(filter_obj)
     assert len(results) == 1
     assert results[0]["id"] == trade1["id"]
 
 
-def test_filter_deeply_nested_field():
+def test_filter_deeply_nested_field(service, context):
     """
     Test filtering on deeply nested field paths.
     
     Requirements: 6.2
     """
-    store = InMemoryStore()
-    service = TradeService(store)
-    context = generate_context()
-    
     # Create trade with deeply nested structure
     trade = {
-        "id": str(uuid.uuid4()),
+        "id": next_id(),
         "data": {
             "level1": {
                 "level2": {
@@ -305,158 +302,131 @@ def test_filter_deeply_nested_field():
     service.save_new(trade, context)
     
     # Filter on deeply nested field
-    filter_obj = TradeFilter(
-        filter={"data.level1.level2.level3.level4.value": {"eq": "deep_value"}}
-    )
+    filter_obj = eq("data.level1.level2.level3.level4.value", "deep_value")
     
     results = service.load_by_filter(filter_obj)
     assert len(results) == 1
     assert results[0]["id"] == trade["id"]
 
 
-def test_count_with_empty_filter():
+def test_count_with_empty_filter(service, context):
     """
     Test count with empty filter returns total count.
     
     Requirements: 8.1
     """
-    store = InMemoryStore()
-    service = TradeService(store)
-    context = generate_context()
-    
     # Create trades
     num_trades = 7
-    for i in range(num_trades):
-        trade = {
-            "id": str(uuid.uuid4()),
-            "data": {"index": i}
-        }
-        service.save_new(trade, context)
+    service.save_new_batch(
+        [
+            {"id": next_id(), "data": {"index": i}}
+            for i in range(num_trades)
+        ],
+        context
+    )
     
     # Empty filter
-    filter_obj = TradeFilter()
+    filter_obj = EMPTY_FILTER
     
     # Should count all trades
     count = service.count_by_filter(filter_obj)
     assert count == num_trades
 
 
-def test_count_with_no_matches():
+def test_count_with_no_matches(service, context):
     """
     Test count returns zero when no trades match.
     
     Requirements: 8.1
     """
-    store = InMemoryStore()
-    service = TradeService(store)
-    context = generate_context()
-    
     # Create trades
-    for i in range(5):
-        trade = {
-            "id": str(uuid.uuid4()),
-            "data": {"type": f"TYPE_{i}"}
-        }
-        service.save_new(trade, context)
+    service.save_new_batch(
+        [
+            {"id": next_id(), "data": {"type": f"TYPE_{i}"}}
+            for i in range(5)
+        ],
+        context
+    )
     
     # Filter that won't match
-    filter_obj = TradeFilter(
-        filter={"data.type": {"eq": "NONEXISTENT"}}
-    )
+    filter_obj = NO_MATCH_FILTER
     
     # Should return zero
     count = service.count_by_filter(filter_obj)
     assert count == 0
 
 
-def test_list_with_empty_filter():
+def test_list_with_empty_filter(service, context):
     """
     Test list with empty filter returns all trades.
     
     Requirements: 7.1
     """
-    store = InMemoryStore()
-    service = TradeService(store)
-    context = generate_context()
-    
     # Create trades
     num_trades = 6
-    for i in range(num_trades):
-        trade = {
-            "id": str(uuid.uuid4()),
-            "data": {"index": i}
-        }
-        service.save_new(trade, context)
+    service.save_new_batch(
+        [
+            {"id": next_id(), "data": {"index": i}}
+            for i in range(num_trades)
+        ],
+        context
+    )
     
     # Empty filter
-    filter_obj = TradeFilter()
+    filter_obj = EMPTY_FILTER
     
     # Should return all trades
     results = service.list_by_filter(filter_obj)
     assert len(results) == num_trades
 
 
-def test_list_with_no_matches():
+def test_list_with_no_matches(service, context):
     """
     Test list returns empty when no trades match.
     
     Requirements: 7.1
     """
-    store = InMemoryStore()
-    service = TradeService(store)
-    context = generate_context()
-    
     # Create trades
-    for i in range(5):
-        trade = {
-            "id": str(uuid.uuid4()),
-            "data": {"category": f"CAT_{i}"}
-        }
-        service.save_new(trade, context)
+    service.save_new_batch(
+        [
+            {"id": next_id(), "data": {"type": f"TYPE_{i}"}}
+            for i in range(5)
+        ],
+        context
+    )
     
     # Filter that won't match
-    filter_obj = TradeFilter(
-        filter={"data.category": {"eq": "NONEXISTENT"}}
-    )
+    filter_obj = NO_MATCH_FILTER
     
     # Should return empty list
     results = service.list_by_filter(filter_obj)
-    assert len(results) == 0
     assert results == []
 
 
-def test_filter_in_operator():
+def test_filter_in_operator(service, context):
     """
     Test 'in' operator filters correctly.
     
     Requirements: 6.1
     """
-    store = InMemoryStore()
-    service = TradeService(store)
-    context = generate_context()
-    
     # Create trades
     trade1 = {
-        "id": str(uuid.uuid4()),
+        "id": next_id(),
         "data": {"type": "SWAP"}
     }
     trade2 = {
-        "id": str(uuid.uuid4()),
+        "id": next_id(),
         "data": {"type": "OPTION"}
     }
     trade3 = {
-        "id": str(uuid.uuid4()),
+        "id": next_id(),
         "data": {"type": "FUTURE"}
     }
     
-    service.save_new(trade1, context)
-    service.save_new(trade2, context)
-    service.save_new(trade3, context)
+    service.save_new_batch([trade1, trade2, trade3], context)
     
     # Filter with 'in' operator
-    filter_obj = TradeFilter(
-        filter={"data.type": {"in": ["SWAP", "OPTION"]}}
-    )
+    filter_obj = in_("data.type", ["SWAP", "OPTION"])
     
     results = service.load_by_filter(filter_obj)
     assert len(results) == 2
@@ -467,76 +437,60 @@ def test_filter_in_operator():
     assert trade3["id"] not in result_ids
 
 
-def test_filter_nin_operator():
+def test_filter_nin_operator(service, context):
     """
     Test 'nin' (not in) operator filters correctly.
     
     Requirements: 6.1
     """
-    store = InMemoryStore()
-    service = TradeService(store)
-    context = generate_context()
-    
     # Create trades
     trade1 = {
-        "id": str(uuid.uuid4()),
+        "id": next_id(),
         "data": {"type": "SWAP"}
     }
     trade2 = {
-        "id": str(uuid.uuid4()),
+        "id": next_id(),
         "data": {"type": "OPTION"}
     }
     trade3 = {
-        "id": str(uuid.uuid4()),
+        "id": next_id(),
         "data": {"type": "FUTURE"}
     }
     
-    service.save_new(trade1, context)
-    service.save_new(trade2, context)
-    service.save_new(trade3, context)
+    service.save_new_batch([trade1, trade2, trade3], context)
     
     # Filter with 'nin' operator
-    filter_obj = TradeFilter(
-        filter={"data.type": {"nin": ["SWAP", "OPTION"]}}
-    )
+    filter_obj = nin("data.type", ["SWAP", "OPTION"])
     
     results = service.load_by_filter(filter_obj)
     assert len(results) == 1
     assert results[0]["id"] == trade3["id"]
 
 
-def test_filter_ne_operator():
+def test_filter_ne_operator(service, context):
     """
     Test 'ne' (not equal) operator filters correctly.
     
     Requirements: 6.1
     """
-    store = InMemoryStore()
-    service = TradeService(store)
-    context = generate_context()
-    
     # Create trades
     trade1 = {
-        "id": str(uuid.uuid4()),
+        "id": next_id(),
         "data": {"status": "ACTIVE"}
     }
     trade2 = {
-        "id": str(uuid.uuid4()),
+        "id": next_id(),
         "data": {"status": "INACTIVE"}
     }
     trade3 = {
-        "id": str(uuid.uuid4()),
+        "id": next_id(),
         "data": {"status": "PENDING"}
     }
     
-    service.save_new(trade1, context)
-    service.save_new(trade2, context)
-    service.save_new(trade3, context)
+    service.save_new_batch([trade1, trade2, trade3], context)
     
     # Filter with 'ne' operator
-    filter_obj = TradeFilter(
-        filter={"data.status": {"ne": "ACTIVE"}}
-    )
+    filter_obj = ne("data.status", "ACTIVE")
     
     results = service.load_by_filter(filter_obj)
     assert len(results) == 2
@@ -545,3 +499,155 @@ def test_filter_ne_operator():
     assert trade1["id"] not in result_ids
     assert trade2["id"] in result_ids
     assert trade3["id"] in result_ids
+
+
+def test_indexed_eq_filter_tracks_updates_and_deletes():
+    """
+    Test that eq filters on an indexed path follow saves, updates and deletes.
+    
+    Requirements: 6.1
+    """
+    store = InMemoryStore(indexed_paths=("data.type",))
+    service = TradeService(store)
+    context = generate_context()
+    
+    trade1 = {"id": "trade-1", "data": {"type": "SWAP"}}
+    trade2 = {"id": "trade-2", "data": {"type": "SWAP"}}
+    trade3 = {"id": "trade-3", "data": {"type": "OPTION"}}
+    for trade in (trade1, trade2, trade3):
+        service.save_new(trade, context)
+    
+    swap_filter = eq("data.type", "SWAP")
+    assert {t["id"] for t in service.load_by_filter(swap_filter)} == {"trade-1", "trade-2"}
+    
+    # Moving a trade to another value removes it from the old bucket
+    service.save_update({"id": "trade-2", "data": {"type": "OPTION"}}, context)
+    assert [t["id"] for t in service.load_by_filter(swap_filter)] == ["trade-1"]
+    
+    service.delete_by_id("trade-1", context)
+    assert service.load_by_filter(swap_filter) == []
+    assert service.count_by_filter(swap_filter) == 0
+    
+    option_filter = TradeFilter(
+        filter={"data.type": {"eq": "OPTION"}, "data.missing": {"eq": None}}
+    )
+    assert {t["id"] for t in service.load_by_filter(option_filter)} == {"trade-2", "trade-3"}
+
+
+def test_indexed_eq_filter_keeps_store_order():
+    """
+    Test that an updated trade keeps its place in indexed eq results.
+
+    Requirements: 6.1
+    """
+    store = InMemoryStore(indexed_paths=("data.type",))
+    service = TradeService(store)
+    context = generate_context()
+
+    service.save_new_batch(
+        [{"id": f"trade-{i}", "data": {"type": "SWAP"}} for i in range(1, 4)],
+        context
+    )
+
+    # Leave the bucket and rejoin it; the store keeps trade-1 first
+    service.save_update({"id": "trade-1", "data": {"type": "OPTION"}}, context)
+    service.save_update({"id": "trade-1", "data": {"type": "SWAP"}}, context)
+
+    results = service.load_by_filter(eq("data.type", "SWAP"))
+    assert [t["id"] for t in results] == [t["id"] for t in store.get_all()]
+
+
+def test_indexed_eq_filter_unhashable_values():
+    """
+    Test that unhashable values on an indexed path fall back to scanning.
+    
+    Requirements: 6.1
+    """
+    store = InMemoryStore(indexed_paths=("data.tags",))
+    service = TradeService(store)
+    context = generate_context()
+    
+    trade1 = {"id": "trade-1", "data": {"tags": ["a", "b"]}}
+    trade2 = {"id": "trade-2", "data": {"tags": ["c"]}}
+    service.save_new_batch([trade1, trade2], context)
+    
+    filter_obj = TradeFilter(filter={"data.tags": {"eq": ["a", "b"]}})
+    
+    results = service.load_by_filter(filter_obj)
+    assert len(results) == 1
+    assert results[0]["id"] == trade1["id"]
+
+
+def test_indexed_range_filter_tracks_updates_and_deletes():
+    """
+    Test that range filters on an indexed path follow saves, updates and deletes.
+    
+    Requirements: 6.1
+    """
+    store = InMemoryStore(indexed_paths=("data.amount",))
+    service = TradeService(store)
+    context = generate_context()
+    
+    amounts = {"trade-1": 50, "trade-2": 100, "trade-3": 150.5, "trade-4": None, "trade-5": 200}
+    for trade_id, amount in amounts.items():
+        service.save_new({"id": trade_id, "data": {"amount": amount}}, context)
+    
+    def matching_ids(conditions):
+        filter_obj = TradeFilter(filter={"data.amount": conditions})
+        return {t["id"] for t in service.load_by_filter(filter_obj)}
+    
+    assert matching_ids({"gte": 100, "lte": 200}) == {"trade-2", "trade-3", "trade-5"}
+    assert matching_ids({"gt": 100, "lt": 200}) == {"trade-3"}
+    assert matching_ids({"lt": 100}) == {"trade-1"}
+    assert matching_ids({"gt": 500}) == set()
+    
+    service.save_update({"id": "trade-2", "data": {"amount": 10}}, context)
+    service.delete_by_id("trade-5", context)
+    assert matching_ids({"gte": 100}) == {"trade-3"}
+    assert matching_ids({"lte": 50}) == {"trade-1", "trade-2"}
+
+
+def test_indexed_range_filter_keeps_store_order():
+    """
+    Test that indexed range results come back in store order, not value order.
+
+    Requirements: 6.1
+    """
+    store = InMemoryStore(indexed_paths=("data.amount",))
+    service = TradeService(store)
+    context = generate_context()
+
+    service.save_new_batch(
+        [
+            {"id": "trade-1", "data": {"amount": 300}},
+            {"id": "trade-2", "data": {"amount": 100}},
+            {"id": "trade-3", "data": {"amount": 200}},
+        ],
+        context
+    )
+
+    filter_obj = TradeFilter(filter={"data.amount": {"gte": 100}})
+
+    results = service.load_by_filter(filter_obj)
+    assert [t["id"] for t in results] == ["trade-1", "trade-2", "trade-3"]
+
+
+def test_indexed_range_filter_non_numeric_values():
+    """
+    Test that non-numeric values on an indexed path fall back to scanning.
+    
+    Requirements: 6.1
+    """
+    store = InMemoryStore(indexed_paths=("data.trade_date",))
+    service = TradeService(store)
+    context = generate_context()
+    
+    trade1 = {"id": "trade-1", "data": {"trade_date": "2024-01-15"}}
+    trade2 = {"id": "trade-2", "data": {"trade_date": "2024-06-30"}}
+    service.save_new_batch([trade1, trade2], context)
+    
+    filter_obj = TradeFilter(filter={"data.trade_date": {"gte": "2024-03-01"}})
+    
+    results = service.load_by_filter(filter_obj)
+    assert len(results) == 1
+    assert results[0]["id"] == trade2["id"]
@@ -1,31 +1,35 @@
 """Unit tests for health check endpoints."""
 
 import pytest
-from fastapi.testclient import TestClient
 
-from tcs_store.main import app
 
-client = TestClient(app)
+# Each endpoint is requested once per session and every test asserts against
+# that response; only the timestamp would differ between requests.
+@pytest.fixture(scope="session")
+def health_response(client):
+    """Return the response to a single GET /health."""
+    return client.get("/health")
 
 
-def test_health_endpoint_returns_200():
-    """
-    Test that health endpoint returns 200 status code.
-    
-    Validates: Requirements 14.1, 14.2, 14.3
-    """
-    response = client.get("/health")
-    
-    assert response.status_code == 200
+@pytest.fixture(scope="session")
+def liveness_response(client):
+    """Return the response to a single GET /health/live."""
+    return client.get("/health/live")
 
 
-def test_health_endpoint_returns_service_information():
+@pytest.fixture(scope="session")
+def readiness_response(client):
+    """Return the response to a single GET /health/ready."""
+    return client.get("/health/ready")
+
+
+def test_health_endpoint_returns_service_information(health_response):
     """
     Test that health endpoint returns service status, version, and timestamp.
     
     Validates: Requirements 14.1, 14.2, 14.3
     """
-    response = client.get("/health")
+    response = health_response
     
     assert response.status_code == 200
     
@@ -47,13 +51,13 @@ def test_health_endpoint_returns_service_information():
     assert len(data["timestamp"]) > 0
 
 
-def test_health_endpoint_status_is_healthy():
+def test_health_endpoint_status_is_healthy(health_response):
     """
     Test that health endpoint returns 'healthy' status.
     
     Validates: Requirements 14.1, 14.2, 14.3
     """
-    response = client.get("/health")
+    response = health_response
     
     assert response.status_code == 200
     
@@ -61,7 +65,7 @@ def test_health_endpoint_status_is_healthy():
     assert data["status"] == "healthy"
 
 
-def test_health_endpoint_no_context_required():
+def test_health_endpoint_no_context_required(health_response):
     """
     Test that health endpoint does not require context metadata.
     
@@ -70,7 +74,7 @@ def test_health_endpoint_no_context_required():
     Validates: Requirements 14.1, 14.2, 14.3
     """
     # Health endpoint should work with just a GET request
-    response = client.get("/health")
+    response = health_response
     
     assert response.status_code == 200
     
@@ -81,24 +85,13 @@ def test_health_endpoint_no_context_required():
     assert "timestamp" in data
 
 
-def test_liveness_endpoint_returns_200():
-    """
-    Test that liveness probe endpoint returns 200 status code.
-    
-    Validates: Requirements 14.1, 14.2, 14.3
-    """
-    response = client.get("/health/live")
-    
-    assert response.status_code == 200
-
-
-def test_liveness_endpoint_returns_service_information():
+def test_liveness_endpoint_returns_service_information(liveness_response):
     """
     Test that liveness endpoint returns service status, version, and timestamp.
     
     Validates: Requirements 14.1, 14.2, 14.3
     """
-    response = client.get("/health/live")
+    response = liveness_response
     
     assert response.status_code == 200
     
@@ -117,24 +110,13 @@ def test_liveness_endpoint_returns_service_information():
     assert isinstance(data["timestamp"], str)
 
 
-def test_readiness_endpoint_returns_200():
-    """
-    Test that readiness probe endpoint returns 200 status code when ready.
-    
-    Validates: Requirements 14.1, 14.2, 14.3
-    """
-    response = client.get("/health/ready")
-    
-    assert response.status_code == 200
-
-
-def test_readiness_endpoint_returns_checks():
+def test_readiness_endpoint_returns_checks(readiness_response):
     """
     Test that readiness endpoint returns dependency checks.
     
     Validates: Requirements 14.1, 14.2, 14.3
     """
-    response = client.get("/health/ready")
+    response = readiness_response
     
     assert response.status_code == 200
     
@@ -187,15 +187,20 @@ class TestTradeFilterModel:
 class TestRequestModels:
     """Tests for request models."""
     
-    def test_save_new_request_valid(self):
+    @pytest.fixture(scope="class")
+    def ctx(self):
+        """Validate one context for the class; tests vary it with model_copy."""
+        return Context(
+            user="trader_123",
+            agent="trading_platform",
+            action="save_new",
+            intent="new_trade_booking"
+        )
+    
+    def test_save_new_request_valid(self, ctx):
         """Test creating a valid SaveNewRequest."""
         request = SaveNewRequest(
-            context=Context(
-                user="trader_123",
-                agent="trading_platform",
-                action="save_new",
-                intent="new_trade_booking"
-            ),
+            context=ctx,
             trade={"id": "trade-123", "data": {"trade_type": "IR_SWAP"}}
         )
         assert request.context.user == "trader_123"
@@ -209,84 +214,54 @@ class TestRequestModels:
             )
         assert "context" in str(exc_info.value)
     
-    def test_partial_update_request_valid(self):
+    def test_partial_update_request_valid(self, ctx):
         """Test creating a valid PartialUpdateRequest."""
         request = PartialUpdateRequest(
-            context=Context(
-                user="trader_123",
-                agent="trading_platform",
-                action="save_partial",
-                intent="update_schedule"
-            ),
+            context=ctx.model_copy(update={"action": "save_partial", "intent": "update_schedule"}),
             id="trade-123",
             updates={"data": {"leg1": {"notional": 2000000}}}
         )
         assert request.id == "trade-123"
         assert "data" in request.updates
     
-    def test_partial_update_request_empty_id(self):
+    def test_partial_update_request_empty_id(self, ctx):
         """Test that empty ID raises validation error."""
         with pytest.raises(ValidationError):
             PartialUpdateRequest(
-                context=Context(
-                    user="trader_123",
-                    agent="trading_platform",
-                    action="save_partial",
-                    intent="update_schedule"
-                ),
+                context=ctx.model_copy(update={"action": "save_partial", "intent": "update_schedule"}),
                 id="",
                 updates={"data": {"leg1": {"notional": 2000000}}}
             )
     
-    def test_load_group_request_valid(self):
+    def test_load_group_request_valid(self, ctx):
         """Test creating a valid LoadGroupRequest."""
         request = LoadGroupRequest(
-            context=Context(
-                user="trader_123",
-                agent="trading_platform",
-                action="load_group",
-                intent="portfolio_review"
-            ),
+            context=ctx.model_copy(update={"action": "load_group", "intent": "portfolio_review"}),
             ids=["trade-123", "trade-456"]
         )
         assert len(request.ids) == 2
         assert "trade-123" in request.ids
     
-    def test_load_group_request_empty_ids(self):
+    def test_load_group_request_empty_ids(self, ctx):
         """Test that empty IDs list raises validation error."""
         with pytest.raises(ValidationError):
             LoadGroupRequest(
-                context=Context(
-                    user="trader_123",
-                    agent="trading_platform",
-                    action="load_group",
-                    intent="portfolio_review"
-                ),
+                context=ctx.model_copy(update={"action": "load_group", "intent": "portfolio_review"}),
                 ids=[]
             )
     
-    def test_delete_group_request_valid(self):
+    def test_delete_group_request_valid(self, ctx):
         """Test creating a valid DeleteGroupRequest."""
         request = DeleteGroupRequest(
-            context=Context(
-                user="trader_123",
-                agent="trading_platform",
-                action="delete_group",
-                intent="cleanup"
-            ),
+            context=ctx.model_copy(update={"action": "delete_group", "intent": "cleanup"}),
             ids=["trade-123", "trade-456"]
         )
         assert len(request.ids) == 2
     
-    def test_request_serialization(self):
+    def test_request_serialization(self, ctx):
         """Test request serialization."""
         request = SaveNewRequest(
-            context=Context(
-                user="trader_123",
-                agent="trading_platform",
-                action="save_new",
-                intent="new_trade_booking"
-            ),
+            context=ctx,
             trade={"id": "trade-123", "data": {"trade_type": "IR_SWAP"}}
         )
         data = request.model_dump()
@@ -1,6 +1,8 @@
 """Unit tests for TradeService."""
 
+import copy
 import pytest
+from pydantic import ValidationError
 
 from tcs_store.storage.in_memory_store import InMemoryStore
 from tcs_store.services.trade_service import TradeService
@@ -12,328 +14,249 @@ from tcs_store.exceptions import (
 )
 
 
-def create_context():
-    """Create a valid context for testing."""
-    return Context(
-        user="test_user",
-        agent="test_agent",
-        action="test_action",
-        intent="test_intent"
-    )
+# Any warning raised while these tests run is a failure
+pytestmark = pytest.mark.filterwarnings("error")
+
+
+def assert_all_missing(service, trade_ids):
+    """Assert that loading each of trade_ids raises TradeNotFoundError."""
+    for trade_id in trade_ids:
+        with pytest.raises(TradeNotFoundError):
+            service.load_by_id(trade_id)
+
+
+# Built once at import; no test mutates it
+TEST_CONTEXT = Context(
+    user="test_user",
+    agent="test_agent",
+    action="test_action",
+    intent="test_intent"
+)
+
+
+@pytest.fixture(scope="module")
+def context():
+    """Provide one valid context for the whole module."""
+    return TEST_CONTEXT
+
+
+@pytest.fixture
+def store():
+    """Provide a fresh in-memory store for each test."""
+    return InMemoryStore()
+
+
+@pytest.fixture
+def service(store):
+    """Provide a trade service bound to the test's store."""
+    return TradeService(store)
 
 
 class TestTradeServiceErrors:
     """Tests for TradeService error conditions."""
     
+    @pytest.fixture(autouse=True)
+    def _setup(self, store, service, context):
+        """Attach the store, service and context to each test instance."""
+        self.store = store
+        self.service = service
+        self.context = context
+    
     def test_save_new_duplicate_error(self):
         """Test that saving a duplicate trade raises TradeAlreadyExistsError."""
-        store = InMemoryStore()
-        service = TradeService(store)
-        context = create_context()
-        
         trade = {"id": "trade-123", "data": {"test": "value"}}
-        service.save_new(trade, context)
+        self.service.save_new(trade, self.context)
         
         # Attempt to save again should raise error
         with pytest.raises(TradeAlreadyExistsError) as exc_info:
-            service.save_new(trade, context)
+            self.service.save_new(trade, self.context)
         
-        assert "trade-123" in str(exc_info.value)
-        assert "already exists" in str(exc_info.value).lower()
+        message = str(exc_info.value).lower()
+        assert "trade-123" in message
+        assert "already exists" in message
     
     def test_save_update_not_found_error(self):
         """Test that updating non-existent trade raises TradeNotFoundError."""
-        store = InMemoryStore()
-        service = TradeService(store)
-        context = create_context()
-        
         trade = {"id": "nonexistent-trade", "data": {"test": "value"}}
         
         with pytest.raises(TradeNotFoundError) as exc_info:
-            service.save_update(trade, context)
+            self.service.save_update(trade, self.context)
         
-        assert "nonexistent-trade" in str(exc_info.value)
-        assert "not found" in str(exc_info.value).lower()
+        message = str(exc_info.value).lower()
+        assert "nonexistent-trade" in message
+        assert "not found" in message
     
     def test_load_by_id_not_found_error(self):
         """Test that loading non-existent trade raises TradeNotFoundError."""
-        store = InMemoryStore()
-        service = TradeService(store)
-        
         with pytest.raises(TradeNotFoundError) as exc_info:
-            service.load_by_id("nonexistent-trade")
+            self.service.load_by_id("nonexistent-trade")
         
-        assert "nonexistent-trade" in str(exc_info.value)
-        assert "not found" in str(exc_info.value).lower()
+        message = str(exc_info.value).lower()
+        assert "nonexistent-trade" in message
+        assert "not found" in message
     
-    def test_save_new_missing_id(self):
-        """Test that saving trade without ID raises ValueError."""
-        store = InMemoryStore()
-        service = TradeService(store)
-        context = create_context()
-        
+    @pytest.mark.parametrize("method", ["save_new", "save_update"])
+    def test_save_missing_id(self, method):
+        """Test that saving or updating a trade without ID raises ValueError."""
         trade = {"data": {"test": "value"}}  # No ID
         
         with pytest.raises(ValueError) as exc_info:
-            service.save_new(trade, context)
+            getattr(self.service, method)(trade, self.context)
         
         assert "id" in str(exc_info.value).lower()
     
-    def test_save_update_missing_id(self):
-        """Test that updating trade without ID raises ValueError."""
-        store = InMemoryStore()
-        service = TradeService(store)
-        context = create_context()
-        
-        trade = {"data": {"test": "value"}}  # No ID
-        
-        with pytest.raises(ValueError) as exc_info:
-            service.save_update(trade, context)
-        
-        assert "id" in str(exc_info.value).lower()
-    
-    def test_invalid_context_empty_user(self):
-        """Test that empty user in context raises validation error."""
-        store = InMemoryStore()
-        service = TradeService(store)
-        
-        # Pydantic will catch empty strings at model validation level
-        from pydantic import ValidationError
+    @pytest.mark.parametrize("bad", ["", "   "])
+    @pytest.mark.parametrize("field", ["user", "agent", "action", "intent"])
+    def test_context_invalid_field(self, field, bad):
+        """Test that an empty or whitespace-only context field raises a validation error."""
+        # Pydantic validates at model creation, so this raises ValidationError
+        kwargs = {
+            "user": "test_user",
+            "agent": "test_agent",
+            "action": "test_action",
+            "intent": "test_intent",
+        }
+        kwargs[field] = bad
         
         with pytest.raises(ValidationError):
-            Context(
-                user="",
-                agent="test_agent",
-                action="test_action",
-                intent="test_intent"
-            )
+            Context(**kwargs)
     
     def test_delete_nonexistent_succeeds(self):
         """Test that deleting non-existent trade succeeds (idempotent)."""
-        store = InMemoryStore()
-        service = TradeService(store)
-        context = create_context()
-        
         # Should not raise any error
-        service.delete_by_id("nonexistent-trade", context)
+        self.service.delete_by_id("nonexistent-trade", self.context)
     
     def test_save_new_then_update_succeeds(self):
         """Test that save_new followed by save_update works correctly."""
-        store = InMemoryStore()
-        service = TradeService(store)
-        context = create_context()
-        
         # Save new trade
         trade = {"id": "trade-123", "data": {"version": 1}}
-        service.save_new(trade, context)
+        self.service.save_new(trade, self.context)
         
         # Update should succeed
         updated_trade = {"id": "trade-123", "data": {"version": 2}}
-        result = service.save_update(updated_trade, context)
+        result = self.service.save_update(updated_trade, self.context)
         
         assert result["data"]["version"] == 2
         
         # Load and verify
-        loaded = service.load_by_id("trade-123")
+        loaded = self.service.load_by_id("trade-123")
         assert loaded["data"]["version"] == 2
     
-    def test_context_validation_all_fields(self):
-        """Test context validation for all required fields."""
-        from pydantic import ValidationError
-        
-        # Pydantic validates at model creation, so these will raise ValidationError
-        # Test empty user
-        with pytest.raises(ValidationError):
-            Context(
-                user="   ",
-                agent="test_agent",
-                action="test_action",
-                intent="test_intent"
-            )
-        
-        # Test empty agent
-        with pytest.raises(ValidationError):
-            Context(
-                user="test_user",
-                agent="   ",
-                action="test_action",
-                intent="test_intent"
-            )
-        
-        # Test empty action
-        with pytest.raises(ValidationError):
-            Context(
-                user="test_user",
-                agent="test_agent",
-                action="   ",
-                intent="test_intent"
-            )
+    def test_save_new_batch_duplicate_error(self):
+        """Test that a batch containing an existing ID is rejected without writing."""
+        self.service.save_new({"id": "trade-1", "data": {"test": "value1"}}, self.context)
+        
+        batch = [
+            {"id": "trade-2", "data": {"test": "value2"}},
+            {"id": "trade-1", "data": {"test": "changed"}},
+        ]
+        with pytest.raises(TradeAlreadyExistsError) as exc_info:
+            self.service.save_new_batch(batch, self.context)
         
-        # Test empty intent
-        with pytest.raises(ValidationError):
-            Context(
-                user="test_user",
-                agent="test_agent",
-                action="test_action",
-                intent="   "
-            )
+        assert "trade-1" in str(exc_info.value)
+        assert not self.store.exists("trade-2")
+        assert self.service.load_by_id("trade-1")["data"]["test"] == "value1"
+    
+    def test_save_new_batch_repeated_id_error(self):
+        """Test that an ID repeated within one batch raises TradeAlreadyExistsError."""
+        batch = [
+            {"id": "trade-1", "data": {"test": "value1"}},
+            {"id": "trade-1", "data": {"test": "value2"}},
+        ]
+        with pytest.raises(TradeAlreadyExistsError):
+            self.service.save_new_batch(batch, self.context)
+        
+        assert self.store.get_all() == []
+    
+    def test_save_new_batch_logs_each_trade(self):
+        """Test that a batch save stores every trade and logs one save per trade."""
+        batch = [{"id": f"trade-{i}", "data": {"index": i}} for i in range(3)]
+        self.service.save_new_batch(batch, self.context)
+        
+        for trade in batch:
+            assert self.service.load_by_id(trade["id"]) == trade
+        
+        log = self.store.get_operation_log()
+        assert [entry["trade_id"] for entry in log] == ["trade-0", "trade-1", "trade-2"]
+        assert all(entry["operation"] == "save" for entry in log)
+        assert all(entry["context"] == self.context.model_dump() for entry in log)
+
+
+_SEEDED_TRADES = {
+    f"trade-{i}": {"id": f"trade-{i}", "data": {"test": f"value{i}"}}
+    for i in range(1, 4)
+}
 
+# (ids, IDs expected to exist, IDs expected to be reported missing)
+_BULK_ID_SCENARIOS = [
+    pytest.param([], [], [], id="empty_list"),
+    pytest.param(
+        ["missing-1", "missing-2", "missing-3"],
+        [],
+        ["missing-1", "missing-2", "missing-3"],
+        id="all_missing",
+    ),
+    pytest.param(
+        ["trade-1", "missing-1", "trade-2", "missing-2"],
+        ["trade-1", "trade-2"],
+        ["missing-1", "missing-2"],
+        id="mix_existing_and_missing",
+    ),
+]
 
 
 class TestBulkOperationEdgeCases:
     """Tests for bulk operation edge cases."""
     
-    def test_load_by_ids_empty_list(self):
-        """Test loading with empty ID list returns empty results."""
-        store = InMemoryStore()
-        service = TradeService(store)
-        context = create_context()
-        
-        # Save some trades
-        service.save_new({"id": "trade-1", "data": {"test": "value1"}}, context)
-        service.save_new({"id": "trade-2", "data": {"test": "value2"}}, context)
-        
-        # Load with empty list
-        found_trades, missing_ids = service.load_by_ids([])
-        
-        assert len(found_trades) == 0
-        assert len(missing_ids) == 0
-    
-    def test_load_by_ids_all_missing(self):
-        """Test loading when all IDs are missing."""
-        store = InMemoryStore()
-        service = TradeService(store)
-        context = create_context()
-        
-        # Save some trades
-        service.save_new({"id": "trade-1", "data": {"test": "value1"}}, context)
-        service.save_new({"id": "trade-2", "data": {"test": "value2"}}, context)
-        
-        # Try to load non-existent trades
-        missing_trade_ids = ["missing-1", "missing-2", "missing-3"]
-        found_trades, missing_ids = service.load_by_ids(missing_trade_ids)
-        
-        assert len(found_trades) == 0
-        assert len(missing_ids) == 3
-        assert set(missing_ids) == set(missing_trade_ids)
+    @pytest.fixture
+    def populated_service(self, store, service, context):
+        """
+        Provide a service holding trade-1, trade-2 and trade-3.
+        
+        The seed trades are built once per module and deep-copied straight
+        into the test's fresh store, skipping the service's per-trade checks,
+        so data checks compare against an untouched original.
+        """
+        store.save_many(copy.deepcopy(_SEEDED_TRADES), context.model_dump())
+        return service
     
-    def test_load_by_ids_mix_existing_and_missing(self):
-        """Test loading with mix of existing and missing IDs."""
-        store = InMemoryStore()
-        service = TradeService(store)
-        context = create_context()
-        
-        # Save some trades
-        trade1 = {"id": "trade-1", "data": {"test": "value1"}}
-        trade2 = {"id": "trade-2", "data": {"test": "value2"}}
-        service.save_new(trade1, context)
-        service.save_new(trade2, context)
-        
-        # Load mix of existing and missing
-        all_ids = ["trade-1", "missing-1", "trade-2", "missing-2"]
-        found_trades, missing_ids = service.load_by_ids(all_ids)
-        
-        # Verify found trades
-        assert len(found_trades) == 2
-        found_ids = [t["id"] for t in found_trades]
-        assert "trade-1" in found_ids
-        assert "trade-2" in found_ids
-        
-        # Verify missing IDs
-        assert len(missing_ids) == 2
-        assert "missing-1" in missing_ids
-        assert "missing-2" in missing_ids
-        
-        # Verify trade data is correct
+    @pytest.mark.parametrize("ids,expected_found,expected_missing", _BULK_ID_SCENARIOS)
+    def test_load_by_ids_scenarios(self, populated_service, ids, expected_found, expected_missing):
+        """Test loading with empty, all-missing and mixed ID lists."""
+        found_trades, missing_ids = populated_service.load_by_ids(ids)
+        
+        # Verify found trades and their data
+        assert len(found_trades) == len(expected_found)
+        assert {t["id"] for t in found_trades} == set(expected_found)
         for trade in found_trades:
-            if trade["id"] == "trade-1":
-                assert trade == trade1
-            elif trade["id"] == "trade-2":
-                assert trade == trade2
-    
-    def test_delete_by_ids_empty_list(self):
-        """Test deleting with empty ID list."""
-        store = InMemoryStore()
-        service = TradeService(store)
-        context = create_context()
-        
-        # Save some trades
-        service.save_new({"id": "trade-1", "data": {"test": "value1"}}, context)
-        service.save_new({"id": "trade-2", "data": {"test": "value2"}}, context)
-        
-        # Delete with empty list
-        deleted_count, missing_ids = service.delete_by_ids([], context)
-        
-        assert deleted_count == 0
-        assert len(missing_ids) == 0
-        
-        # Verify trades still exist
-        assert service.load_by_id("trade-1") is not None
-        assert service.load_by_id("trade-2") is not None
-    
-    def test_delete_by_ids_all_missing(self):
-        """Test deleting when all IDs are missing."""
-        store = InMemoryStore()
-        service = TradeService(store)
-        context = create_context()
-        
-        # Save some trades
-        service.save_new({"id": "trade-1", "data": {"test": "value1"}}, context)
-        service.save_new({"id": "trade-2", "data": {"test": "value2"}}, context)
-        
-        # Try to delete non-existent trades
-        missing_trade_ids = ["missing-1", "missing-2", "missing-3"]
-        deleted_count, missing_ids = service.delete_by_ids(missing_trade_ids, context)
-        
-        assert deleted_count == 0
-        assert len(missing_ids) == 3
-        assert set(missing_ids) == set(missing_trade_ids)
-        
-        # Verify existing trades still exist
-        assert service.load_by_id("trade-1") is not None
-        assert service.load_by_id("trade-2") is not None
-    
-    def test_delete_by_ids_mix_existing_and_missing(self):
-        """Test deleting with mix of existing and missing IDs."""
-        store = InMemoryStore()
-        service = TradeService(store)
-        context = create_context()
-        
-        # Save some trades
-        service.save_new({"id": "trade-1", "data": {"test": "value1"}}, context)
-        service.save_new({"id": "trade-2", "data": {"test": "value2"}}, context)
-        service.save_new({"id": "trade-3", "data": {"test": "value3"}}, context)
-        
-        # Delete mix of existing and missing
-        all_ids = ["trade-1", "missing-1", "trade-2", "missing-2"]
-        deleted_count, missing_ids = service.delete_by_ids(all_ids, context)
-        
-        # Verify deleted count
-        assert deleted_count == 2
+            assert trade == _SEEDED_TRADES[trade["id"]]
         
         # Verify missing IDs
-        assert len(missing_ids) == 2
-        assert "missing-1" in missing_ids
-        assert "missing-2" in missing_ids
-        
-        # Verify deleted trades are gone
-        with pytest.raises(TradeNotFoundError):
-            service.load_by_id("trade-1")
-        with pytest.raises(TradeNotFoundError):
-            service.load_by_id("trade-2")
-        
-        # Verify non-deleted trade still exists
-        assert service.load_by_id("trade-3") is not None
+        assert len(missing_ids) == len(expected_missing)
+        assert set(missing_ids) == set(expected_missing)
     
-    def test_load_by_ids_preserves_order(self):
+    @pytest.mark.parametrize("ids,expected_deleted,expected_missing", _BULK_ID_SCENARIOS)
+    def test_delete_by_ids_scenarios(self, populated_service, context, ids, expected_deleted, expected_missing):
+        """Test deleting with empty, all-missing and mixed ID lists."""
+        deleted_count, missing_ids = populated_service.delete_by_ids(ids, context)
+        
+        # Verify deleted count and missing IDs
+        assert deleted_count == len(expected_deleted)
+        assert len(missing_ids) == len(expected_missing)
+        assert set(missing_ids) == set(expected_missing)
+        
+        # Verify deleted trades are gone and the rest still exist
+        assert_all_missing(populated_service, expected_deleted)
+        for trade_id in _SEEDED_TRADES.keys() - set(expected_deleted):
+            assert populated_service.load_by_id(trade_id) is not None
+    
+    def test_load_by_ids_preserves_order(self, store, service, context):
         """Test that load_by_ids returns trades in consistent order."""
-        store = InMemoryStore()
-        service = TradeService(store)
-        context = create_context()
-        
-        # Save trades
-        for i in range(5):
-            service.save_new({"id": f"trade-{i}", "data": {"index": i}}, context)
+        # Seed trades straight into the store; only loading is under test
+        store.save_many(
+            {f"trade-{i}": {"id": f"trade-{i}", "data": {"index": i}} for i in range(5)},
+            context.model_dump()
+        )
         
         # Load in specific order
         ids = ["trade-2", "trade-0", "trade-4", "trade-1"]
@@ -343,48 +266,37 @@ class TestBulkOperationEdgeCases:
         assert len(found_trades) == 4
         assert len(missing_ids) == 0
         
-        # Verify all IDs are present
-        found_ids = [t["id"] for t in found_trades]
-        assert set(found_ids) == set(ids)
+        # Verify trades come back in the requested order
+        assert [t["id"] for t in found_trades] == ids
     
-    def test_delete_by_ids_duplicate_ids(self):
+    def test_delete_by_ids_duplicate_ids(self, populated_service, context):
         """Test deleting with duplicate IDs in the list."""
-        store = InMemoryStore()
-        service = TradeService(store)
-        context = create_context()
-        
-        # Save a trade
-        service.save_new({"id": "trade-1", "data": {"test": "value1"}}, context)
+        service = populated_service
         
         # Delete with duplicate IDs
         ids = ["trade-1", "trade-1", "trade-1"]
         deleted_count, missing_ids = service.delete_by_ids(ids, context)
         
-        # Should only count as 1 deletion
-        assert deleted_count == 1
-        assert len(missing_ids) == 2  # The duplicates become "missing" after first delete
+        # Each distinct ID is deleted once; its repeats become "missing"
+        unique_ids = dict.fromkeys(ids)
+        assert deleted_count == len(unique_ids)
+        assert len(missing_ids) == len(ids) - len(unique_ids)
         
         # Verify trade is deleted
-        with pytest.raises(TradeNotFoundError):
-            service.load_by_id("trade-1")
+        assert_all_missing(service, unique_ids)
     
-    def test_load_by_ids_duplicate_ids(self):
+    def test_load_by_ids_duplicate_ids(self, populated_service):
         """Test loading with duplicate IDs in the list."""
-        store = InMemoryStore()
-        service = TradeService(store)
-        context = create_context()
-        
-        # Save a trade
-        trade = {"id": "trade-1", "data": {"test": "value1"}}
-        service.save_new(trade, context)
+        trade = _SEEDED_TRADES["trade-1"]
         
         # Load with duplicate IDs
         ids = ["trade-1", "trade-1", "trade-1"]
-        found_trades, missing_ids = service.load_by_ids(ids)
+        found_trades, missing_ids = populated_service.load_by_ids(ids)
         
-        # Should find the trade once for each request
-        assert len(found_trades) == 3
+        # Should find the trade once for each request, repeats included
+        assert len(found_trades) == len(ids)
         assert len(missing_ids) == 0
+        assert [t["id"] for t in found_trades] == ids
         
         # All should be the same trade
         for found_trade in found_trades: